@@ -47,6 +47,7 @@ RUNNING_SYMBOLS: Final[tuple[str, ...]] = ("/", "-", "\\", "|")
 
 
 PIPE_BUFFER_SIZE: Final = 4 * 1024 * 1024  # 4MB
+OS_PIPE_SIZE: Final = 1024 * 1024  # 1MB, default max for unprivileged users
 
 # for NT ANSI enabling
 NT_STD_OUTPUT_HANDLE: Final = -11
@@ -63,8 +64,15 @@ NT_NAMED_PIPE_BUFFER_SIZE: Final = 65536
 NT_TH32CS_SNAPPROCESS: Final = 0x2
 
 
-# Ubuntu 22.04 uses FFmpeg 4.4.1 which does not support the new format
-FFMPEG_USE_OLD_MERGEPLANES: Final = True
 FFMPEG_VIDEO_MAP: Final = "[v_output]"
+FFMPEG_COLORLEVELS_FILTER: Final = "colorlevels=rimin={}/255:gimin={}/255:bimin={}/255"
 FFMPEG_DEFAULT_LUMA_FORMAT: Final = VideoFormatType.GRAY.value.get(16)
 FFMPEG_DEFAULT_CHROMA_FORMAT: Final = VideoFormatType.YUV444.value.get(16)
+FFMPEG_PROGRESS_OPTS: Final = (
+    "-hide_banner",
+    "-loglevel",
+    "error",
+    "-progress",
+    "pipe:2",
+)
+FFMPEG_VERBOSE_OPTS: Final = ("-hide_banner", "-loglevel", "verbose")
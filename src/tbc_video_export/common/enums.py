@@ -14,9 +14,10 @@ class FlagHelper:
     """
 
     @staticmethod
-    def get_flags(flag: T) -> list[T]:
-        """Return a list of flags contained within a variable."""
-        return [f for f in flag.__class__ if f & flag == f]
+    @cache
+    def get_flags(flag: T) -> tuple[T, ...]:
+        """Return a tuple of flags contained within a variable."""
+        return tuple(f for f in flag.__class__ if f & flag == f)
 
     @staticmethod
     @cache
@@ -43,6 +43,7 @@ class FileHelper:
             self._output_file_name = Path(self._opts.output_file).stem
 
         self.tools = self._get_tool_paths()
+        self._efm_file: Path | None = None
         self.tbcs = self._set_tbc_files()
 
     @cached_property
@@ -67,9 +68,7 @@ class FileHelper:
     @property
     def efm_file(self) -> Path | None:
         """Returns absolute path to EFM file if it exists."""
-        if (file := self.get_input_file_from_ext("efm")).is_file():
-            return file
-        return None
+        return self._efm_file
 
     @property
     def ffmetadata_file(self) -> Path:
@@ -203,29 +202,38 @@ class FileHelper:
         This throws an exception if output file exists.
         """
         if not self._opts.overwrite:
-            files = [self.output_video_file]
+            output_files = [self.output_video_file]
 
             if self._opts.two_step:
-                files.append(self.output_video_file_luma)
+                output_files.append(self.output_video_file_luma)
 
-            for file in files:
-                if file.is_file():
+            existing_files = files.get_existing_files(output_files)
+
+            for file in output_files:
+                if file in existing_files:
                     raise exceptions.FileIOError(
                         f"{file} exists, use --overwrite or move the file."
                     )
 
     def _set_tbc_files(self) -> dict[TBCType, Path]:
-        """Create a dict containing the absolute path to the TBC files based on type."""
+        """Create a dict containing the absolute path to the TBC files based on type.
+
+        The EFM file is checked in the same scan, as it is also an input file.
+        """
         tbcs: dict[TBCType, Path] = {}
 
         # input files
-        tbc = f"{self.input_name}.tbc"
-        tbc_chroma = f"{self.input_name}_chroma.tbc"
+        tbc = Path(f"{self.input_name}.tbc")
+        tbc_chroma = Path(f"{self.input_name}_chroma.tbc")
+        efm = self.get_input_file_from_ext("efm")
+        existing_files = files.get_existing_files((tbc, tbc_chroma, efm))
+
+        self._efm_file = efm if efm in existing_files else None
 
-        if (tbc_chroma := Path(tbc_chroma)).is_file():
+        if tbc_chroma in existing_files:
             tbcs[TBCType.CHROMA] = tbc_chroma
 
-        if (tbc := Path(tbc)).is_file():
+        if tbc in existing_files:
             if TBCType.CHROMA in tbcs:
                 tbcs[TBCType.LUMA] = tbc
             else:
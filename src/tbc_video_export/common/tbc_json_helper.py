@@ -7,6 +7,7 @@ from typing import Any
 
 from tbc_video_export.common import exceptions
 from tbc_video_export.common.enums import VideoSystem
+from tbc_video_export.common.utils import files
 
 
 class TBCJsonHelper:
@@ -17,8 +18,7 @@ class TBCJsonHelper:
             self.file_name = file_name
 
             try:
-                with Path.open(file_name, mode="r", encoding="utf-8") as json_file:
-                    self._json_data = json.load(json_file)
+                self._json_data = files.load_json(file_name)
             except FileNotFoundError as e:
                 raise exceptions.TBCError(f"TBC json not found ({file_name}).") from e
             except PermissionError as e:
@@ -41,20 +41,20 @@ class TBCJsonHelper:
     def file_name(self, file_name: str | Path) -> None:
         self._file_name = Path(file_name)
 
+    @cached_property
+    def _video_parameters(self) -> dict[str, Any]:
+        """Return the videoParameters object from the TBC json."""
+        return self._json_data["videoParameters"]
+
     @cached_property
     def is_widescreen(self) -> bool:
         """Returns whether the json TBC flags widescreen."""
-        return (
-            "isWidescreen" in self._json_data["videoParameters"]
-            and self._json_data["videoParameters"]["isWidescreen"]
-        )
+        return bool(self._video_parameters.get("isWidescreen", False))
 
     @cached_property
     def video_system(self) -> VideoSystem:
         """Return VideoSystem from TBC json."""
-        if "system" in self._json_data["videoParameters"]:
-            system = self._json_data["videoParameters"]["system"]
-
+        if (system := self._video_parameters.get("system")) is not None:
             # search for PAL* or NTSC* in videoParameters.system
             # isSourcePal and isSourceNtsc sometimes used, but not
             # sure if it's worth checking for
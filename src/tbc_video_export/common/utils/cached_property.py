@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+class cached_property(Generic[T]):  # noqa: N801
+    """Lock-free cached_property.
+
+    functools.cached_property takes a lock on first access in python <3.12. State
+    is only ever built from a single thread, so the value is stored directly in the
+    instance dict, which then takes priority over this non-data descriptor.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.attr_name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        """Set the attribute name used to store the value."""
+        self.attr_name = name
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type[Any] | None = None
+    ) -> cached_property[T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type[Any] | None = None) -> T: ...
+
+    def __get__(
+        self, instance: object | None, owner: type[Any] | None = None
+    ) -> T | cached_property[T]:
+        """Return the cached value, computing it on first access."""
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.attr_name] = self.func(instance)
+        return value
@@ -5,9 +5,19 @@ import sys
 from functools import cache
 from pathlib import Path
 from shutil import which
+from typing import TYPE_CHECKING, Any
 
 from tbc_video_export.common import exceptions
 
+try:
+    # orjson is an optional extra (tbc-video-export[orjson]), used if installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @cache
 def get_runtime_directory() -> Path:
@@ -45,3 +55,51 @@ def find_binary(name: str) -> Path:
         return Path(name)
 
     raise exceptions.FileIOError(f"{name} not in PATH or script dir.")
+
+
+def get_existing_files(paths: Iterable[Path]) -> set[Path]:
+    """Return the paths that currently exist as files.
+
+    Each unique parent dir is scanned once, rather than calling stat per file.
+    Scanned names are matched exactly, so any path not matched by the scan is
+    checked with is_file(). This covers case-insensitive filesystems, where a
+    user-supplied name may differ in case from the file on disk, and dirs that
+    cannot be listed.
+    """
+    paths_by_dir: dict[Path, set[Path]] = {}
+
+    for path in paths:
+        paths_by_dir.setdefault(path.parent, set()).add(path)
+
+    existing: set[Path] = set()
+
+    for dir_path, dir_paths in paths_by_dir.items():
+        names = {path.name for path in dir_paths}
+
+        try:
+            with os.scandir(dir_path) as entries:
+                existing.update(
+                    dir_path.joinpath(entry.name)
+                    for entry in entries
+                    if entry.name in names and entry.is_file()
+                )
+        except OSError:
+            pass
+
+        existing.update(
+            path for path in dir_paths if path not in existing and path.is_file()
+        )
+
+    return existing
+
+
+def load_json(path: Path) -> Any:
+    """Return parsed json from a file.
+
+    This uses orjson if it is installed, which is considerably faster than json
+    for large TBC json files. Both raise a json.JSONDecodeError on invalid data,
+    but orjson is stricter: it rejects the NaN and Infinity tokens that json
+    accepts, so such files only load without orjson.
+    """
+    with Path.open(path, mode="rb") as file:
+        return _json_loads(file.read())
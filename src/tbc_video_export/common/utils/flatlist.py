@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import abc
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import TypeAlias
 
@@ -21,24 +21,51 @@ class FlatList:
         """Return True contains data."""
         return len(self.data) > 0
 
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator over the flattened data.
+
+        Values are flattened when appended, so this does not walk nested values.
+        """
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        """Return the number of flattened values."""
+        return len(self.data)
+
     def append(self, values: _FlatListValues) -> None:
-        """Append data to the list."""
-        match values:
-            case None:
-                pass
+        """Append data to the list.
+
+        Nested values are walked with an explicit stack of iterators, rather than
+        recursing once per nesting level.
+        """
+        data = self.data
+        stack: list[Iterator[_FlatListValues]] = [iter((values,))]
+
+        while stack:
+            for value in stack[-1]:
+                match value:
+                    case None:
+                        pass
+
+                    case str():
+                        data.append(value)
 
-            case list() | tuple() | abc.Generator():
-                for v in values:
-                    self.append(v)
+                    case list() | tuple() | abc.Generator():
+                        stack.append(iter(value))
+                        break
 
-            case FlatList():
-                self.append(values.data)
+                    case FlatList():
+                        # data is already flat
+                        data.extend(value.data)
 
-            case v if v is not Sequence:
-                self.data.append(str(values))
+                    case _:
+                        data.append(str(value))
+            else:
+                stack.pop()
 
-            case _:
-                pass
+    def extend(self, values: Iterable[str]) -> None:
+        """Extend the list with already flat string values."""
+        self.data.extend(values)
 
 
 # accepted FlatList values
@@ -28,15 +28,7 @@ class VideoSystemData:
     @staticmethod
     def get(system: VideoSystem) -> VideoSystemData:
         """Returns VideoSystemData for the specified video format."""
-        match system:
-            case VideoSystem.PAL:
-                return video_system_pal
-
-            case VideoSystem.NTSC:
-                return video_system_ntsc
-
-            case VideoSystem.PAL_M:
-                return video_system_palm
+        return _video_systems[system]
 
     @dataclass(frozen=True, slots=True)
     class Size:
@@ -166,6 +158,12 @@ video_system_palm = VideoSystemData(
     ),
 )
 
+_video_systems: dict[VideoSystem, VideoSystemData] = {
+    VideoSystem.PAL: video_system_pal,
+    VideoSystem.NTSC: video_system_ntsc,
+    VideoSystem.PAL_M: video_system_palm,
+}
+
 VideoSizeType: TypeAlias = Literal["default", "4fsc"]
 VideoActiveLinesType: TypeAlias = Literal[
     "default", "full_vertical", "letterbox", "vbi"
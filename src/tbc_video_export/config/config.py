@@ -22,7 +22,7 @@ if TYPE_CHECKING:
         HardwareAccelType,
         VideoSystem,
     )
-    from tbc_video_export.config.json import JsonConfig
+    from tbc_video_export.config.json import JsonConfig, JsonProfile
 
 
 class Config:
@@ -36,6 +36,7 @@ class Config:
     def __init__(self, config_file: str | None = None) -> None:
         self._data: JsonConfig
         self._additional_filters: list[str] = []
+        self._profile_cache: dict[GetProfileFilter, Profile] = {}
 
         # attempt loading user file if set, or exported file from default location
         file_name = (
@@ -44,8 +45,7 @@ class Config:
 
         if file_name is not None:
             try:
-                with Path.open(file_name, mode="r", encoding="utf-8") as file:
-                    self._data = json.load(file)
+                self._data = files.load_json(file_name)
             except (FileNotFoundError, PermissionError, json.JSONDecodeError) as e:
                 raise exceptions.InvalidProfileError(str(e), file_name) from e
 
@@ -58,8 +58,7 @@ class Config:
 
         try:
             for json_profile in self._data["profiles"]:
-                for profile in self._generate_profile(json_profile["name"]):
-                    self.profiles.append(profile)
+                self.profiles.extend(self._generate_profile(json_profile))
         except KeyError as e:
             raise exceptions.InvalidProfileError(
                 "Configuration file missing required fields.", self.get_config_file()
@@ -95,7 +94,14 @@ class Config:
         self._additional_filters.append(filter_name)
 
     def get_profile(self, profile_filter: GetProfileFilter) -> Profile:
-        """Return a profile from a filter."""
+        """Return a profile from a filter.
+
+        Matched profiles are cached by filter, as profiles do not change once
+        loaded.
+        """
+        if (profile := self._profile_cache.get(profile_filter)) is not None:
+            return profile
+
         try:
             profile = next(
                 (profile for profile in self.profiles if profile_filter.match(profile)),
@@ -110,6 +116,7 @@ class Config:
 
                 raise exceptions.InvalidProfileError(err_msg)
 
+            self._profile_cache[profile_filter] = profile
             return profile
         except KeyError as e:
             raise exceptions.InvalidProfileError(
@@ -244,14 +251,8 @@ class Config:
         if (of := filter_profile.other_filter) is not None:
             other_filters.append(of)
 
-    def _generate_profile(self, profile_name: str) -> list[Profile]:
+    def _generate_profile(self, profile_data: JsonProfile) -> list[Profile]:
         try:
-            profile_data = next(
-                profile
-                for profile in self._data["profiles"]
-                if profile["name"] == profile_name
-            )
-
             # get video profile(s) for profile
             if isinstance(profile_data["video_profile"], list):
                 video_profiles = [
@@ -314,7 +315,7 @@ class Config:
             ) from e
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetProfileFilter:
     """Container class for get profile filter params."""
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from tbc_video_export.common import exceptions
@@ -117,7 +118,17 @@ class ProfileVideo(SubProfile):
     @property
     def opts(self) -> FlatList | None:
         """Return the video opts if they exist."""
-        return FlatList(self._profile["opts"]) if "opts" in self._profile else None
+        return FlatList(self._opts) if self._opts is not None else None
+
+    @cached_property
+    def _opts(self) -> tuple[str, ...] | None:
+        """Return the flattened video opts if they exist.
+
+        This is cached as a tuple so callers cannot modify the shared opts.
+        """
+        return (
+            tuple(FlatList(self._profile["opts"])) if "opts" in self._profile else None
+        )
 
     @property
     def video_format(self) -> str:
@@ -141,7 +152,7 @@ class ProfileVideo(SubProfile):
             "filter_profiles_override", self._parent.get("filter_profiles", [])
         )
 
-    @property
+    @cached_property
     def hardware_accel(self) -> HardwareAccelType | None:
         """Return the hardware accel opt."""
         if t := self._profile.get("hardware_accel", False):
@@ -149,7 +160,7 @@ class ProfileVideo(SubProfile):
 
         return None
 
-    @property
+    @cached_property
     def video_system(self) -> VideoSystem | None:
         """Return the video system filter."""
         if "video_system" in self._profile:
@@ -216,9 +227,15 @@ class ProfileAudio(SubProfile):
     @property
     def opts(self) -> FlatList:
         """Return the audio opts if they exist."""
-        return (
-            FlatList(self._profile["opts"]) if "opts" in self._profile else FlatList()
-        )
+        return FlatList(self._opts)
+
+    @cached_property
+    def _opts(self) -> tuple[str, ...]:
+        """Return the flattened audio opts.
+
+        This is cached as a tuple so callers cannot modify the shared opts.
+        """
+        return tuple(FlatList(self._profile["opts"])) if "opts" in self._profile else ()
 
     def __str__(self) -> str:  # noqa: D105
         data = f"  {ansi.dim('Audio Codec:')}\t{self.codec}\n"
@@ -11,6 +11,7 @@ from tbc_video_export.common import exceptions
 from tbc_video_export.common.enums import (
     ChromaDecoder,
     ExportMode,
+    HardwareAccelType,
     TBCType,
     VideoSystem,
 )
@@ -34,6 +35,7 @@ def validate_opts(
     _validate_luma_only_opts(parser, opts)
     _validate_video_format(parser, opts)
     _validate_decoder_opts(state, opts)
+    _validate_ffmpeg_opts(state, opts)
 
 
 def valiate_metadata_file_exists(value: str) -> Path:
@@ -216,3 +218,14 @@ def _validate_decoder_opts(state: ProgramState, opts: Opts) -> None:
             "arguments --reverse: requires --no-dropout-correct, run dropout "
             "correction manually if required"
         )
+
+
+def _validate_ffmpeg_opts(state: ProgramState, opts: Opts) -> None:
+    """Validate FFmpeg opts."""
+    if (
+        opts.low_latency
+        and state.profile.video_profile.hardware_accel is not HardwareAccelType.NVENC
+    ):
+        raise exceptions.InvalidOptsError(
+            "arguments --low-latency: only implemented with NVENC video profiles."
+        )
@@ -147,6 +147,18 @@ def add_ffmpeg_opts(parent: argparse.ArgumentParser) -> None:
         ),
     )
 
+    ffmpeg_opts.add_argument(
+        "--low-latency",
+        action="store_true",
+        default=False,
+        help=(
+            "Use low-latency encoder settings. (default: no)\n"
+            "  - This requires an NVENC video profile.\n"
+            "  - This disables frame buffering and lookahead in the encoder."
+            "\n\n"
+        ),
+    )
+
     ffmpeg_opts.add_argument(
         "--no-attach-json",
         action="store_true",
@@ -6,7 +6,7 @@ from datetime import datetime
 from tbc_video_export.common.enums import ProcessName
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportState:
     """Data from procs that represent the export state."""
 
@@ -44,7 +44,7 @@ class ExportState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportStateSnapshot:
     """Snapshot data from procs, these values are merged with the export state."""
 
@@ -55,7 +55,7 @@ class ExportStateSnapshot:
     concealments: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportStateMessage:
     """Message data from process/wrappers."""
 
@@ -80,22 +80,22 @@ class ProcessHandler:
 
         create_group = partial(WrapperGroup, self._state)
 
-        # group 1 (vbi)
-        # run process vbi
+        # group 1 (standalone)
+        # run process vbi & process efm, these do not depend on each other
         if self._state.opts.process_vbi:
             procs |= ProcessName.LD_PROCESS_VBI
 
-            self._procs[create_group(export_mode, TBCType.NONE, procs)] = []
-
-        procs = ProcessName.NONE
+        if self._state.opts.process_efm:
+            procs |= ProcessName.LD_PROCESS_EFM
 
-        # group 2 (standalone)
-        # run export metadata & process efm
+        # group 2 (metadata)
+        # export metadata reads the tbc json, which process vbi may replace
         if self._state.opts.export_metadata:
-            procs |= ProcessName.LD_EXPORT_METADATA
+            if ProcessName.LD_PROCESS_VBI in procs:
+                self._procs[create_group(export_mode, TBCType.NONE, procs)] = []
+                procs = ProcessName.NONE
 
-        if self._state.opts.process_efm:
-            procs |= ProcessName.LD_PROCESS_EFM
+            procs |= ProcessName.LD_EXPORT_METADATA
 
         if procs != ProcessName.NONE:
             self._procs[create_group(export_mode, TBCType.NONE, procs)] = []
@@ -158,7 +158,11 @@ class ProcessHandler:
         This will loop through process groups and run all of the procs in a group
         before moving to the next group.
         """
-        for group, procs in self._procs.items():
+        for idx, (group, procs) in enumerate(self._procs.items()):
+            # previous groups may have changed the files used by this group
+            if idx > 0:
+                group.invalidate_commands()
+
             async with AsyncExitStack() as pipe_stack:
                 # add required pipes to stack
                 for pipe_group in group.consumable_pipes:
@@ -166,11 +170,13 @@ class ProcessHandler:
 
                 self._state.current_export_mode = group.export_mode
 
-                # start task killer for group
-                self._tasks.add(asyncio.create_task(self._proc_killer(procs)))
+                group_tasks = [asyncio.create_task(proc.run()) for proc in procs]
+                self._proc_tasks.update(group_tasks)
 
-                for proc in procs:
-                    self._proc_tasks.add(asyncio.create_task(proc.run()))
+                # start task killer for group
+                self._tasks.add(
+                    asyncio.create_task(self._proc_killer(procs, group_tasks))
+                )
 
                 # check the return values of procs as they finish and ensure they
                 # are valid
@@ -184,7 +190,9 @@ class ProcessHandler:
                         await self._exit_all()
                         return
 
-    async def _proc_killer(self, procs: list[Process]) -> None:
+    async def _proc_killer(
+        self, procs: list[Process], proc_tasks: list[asyncio.Task[ProcessState]]
+    ) -> None:
         """Proc killing task.
 
         This watches proc states and kills if the only remaining procs are flagged with
@@ -194,36 +202,56 @@ class ProcessHandler:
         run until finished. This is solved on POSIX systems by closing the pipe once the
         consumer is finished, but this does not work on NT systems. This ensures they do
         not keep running.
-        """
-        while not self._proc_error_event.is_set() and not self._stop_event.is_set():
-            await asyncio.sleep(0.1)
 
-            running = [proc for proc in procs if proc.state.running]
-            has_run_count = sum(1 for proc in procs if proc.state.has_run)
+        Proc states are only checked when a proc ends or the handler is stopping,
+        rather than polling.
+        """
+        pending: set[asyncio.Future[Any]] = set(proc_tasks)
+        event_tasks = {
+            asyncio.create_task(self._proc_error_event.wait()),
+            asyncio.create_task(self._stop_event.wait()),
+        }
+
+        try:
+            while (
+                pending
+                and not self._proc_error_event.is_set()
+                and not self._stop_event.is_set()
+            ):
+                _, pending = await asyncio.wait(
+                    pending | event_tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                pending -= event_tasks
 
-            if not len(running):
-                break
+                running = [proc for proc in procs if proc.state.running]
 
-            if not has_run_count:
-                continue
+                if not running:
+                    break
 
-            if has_run_count == len(procs) and all(
-                proc.wrapper.stop_on_last_alive for proc in running
-            ):
-                for proc in running:
-                    logging.getLogger("console").debug(
-                        f"Killing {proc.wrapper.process_name}:{proc.wrapper.tbc_type} "
-                        f"as all other procs have ended"
-                    )
-                    await proc.stop()
+                if all(proc.state.has_run for proc in procs) and all(
+                    proc.wrapper.stop_on_last_alive for proc in running
+                ):
+                    for proc in running:
+                        logging.getLogger("console").debug(
+                            f"Killing {proc.wrapper.process_name}:"
+                            f"{proc.wrapper.tbc_type} as all other procs have ended"
+                        )
+                        await proc.stop()
 
-                break
+                    break
+        finally:
+            for task in event_tasks:
+                task.cancel()
 
     def _print_wrappers(self) -> None:
         """Print wrapper details."""
         for idx, group in enumerate(self._procs):
             logging.getLogger("console").info(ansi.dim(f"Step {idx + 1}"))
 
+            # post-fn of previous groups may have changed state used by this group
+            if idx > 0:
+                group.invalidate_commands()
+
             for wrapper in group.wrappers:
                 # create a string showing ENV items
                 env_variables = (
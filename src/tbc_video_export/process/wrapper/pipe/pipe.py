@@ -77,7 +77,7 @@ class Pipe(ABC):
         """Close pipe."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsumablePipe:
     """Class for grouping pipes together for processes."""
 
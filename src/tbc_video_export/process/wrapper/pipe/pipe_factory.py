@@ -23,7 +23,7 @@ if os.name == "nt":
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PipeFactoryConfig:
     """Config class for PipeFactory creation."""
 
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
 from contextlib import suppress
 from functools import cached_property
 from typing import TYPE_CHECKING
 
+from tbc_video_export.common import consts
 from tbc_video_export.common.enums import PipeType
 from tbc_video_export.process.wrapper.pipe.pipe import Pipe
 
@@ -24,6 +26,7 @@ class PipeOS(Pipe):
         """Enter OS pipe context."""
         logging.getLogger("console").debug("Creating os.pipe")
         self._stdin, self._stdout = os.pipe()
+        self._set_pipe_size()
         return self
 
     async def __aexit__(
@@ -55,6 +58,23 @@ class PipeOS(Pipe):
     def out_handle(self) -> int | None:  # noqa: D102
         return self._stdout
 
+    def _set_pipe_size(self) -> None:
+        """Increase the pipe buffer size.
+
+        The default 64K buffer causes frequent context switches when a decoder is
+        writing raw video. This is only supported on Linux, and can fail if the
+        size exceeds /proc/sys/fs/pipe-max-size, in which case the default is kept.
+        """
+        if sys.platform != "linux" or self._stdout is None:
+            return
+
+        import fcntl
+
+        try:
+            fcntl.fcntl(self._stdout, fcntl.F_SETPIPE_SZ, consts.OS_PIPE_SIZE)
+        except OSError as e:
+            logging.getLogger("console").debug(f"Unable to set pipe size: {e}")
+
     def close(self) -> None:
         """Close the OS pipe."""
         logging.getLogger("console").debug("Closing pipe os.pipe")
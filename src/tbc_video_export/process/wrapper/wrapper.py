@@ -48,18 +48,12 @@ class Wrapper(ABC):
     def pipes(self) -> list[Pipe]:
         """Return pipes for wrapper."""
         pipes: list[Pipe] = []
-        in_pipe = self._config.input_pipes
-        out_pipe = self._config.output_pipes
 
-        if isinstance(in_pipe, tuple):
-            pipes += in_pipe
-        elif isinstance(in_pipe, Pipe):
-            pipes = [*pipes, in_pipe]
-
-        if isinstance(out_pipe, tuple):
-            pipes += out_pipe
-        elif isinstance(out_pipe, Pipe):
-            pipes = [*pipes, out_pipe]
+        for pipe in (self._config.input_pipes, self._config.output_pipes):
+            if isinstance(pipe, tuple):
+                pipes.extend(pipe)
+            elif isinstance(pipe, Pipe):
+                pipes.append(pipe)
 
         return pipes
 
@@ -70,11 +64,18 @@ class Wrapper(ABC):
         This will run after the process has finished running.
         """
 
-    @property
+    @cached_property
     @abstractmethod
     def command(self) -> FlatList:
         """Return wrapped process arguments."""
 
+    def invalidate_command(self) -> None:
+        """Discard the cached command so it is rebuilt on next access.
+
+        Commands may depend on files or state produced by previously run procs.
+        """
+        self.__dict__.pop("command", None)
+
     @cached_property
     @abstractmethod
     def process_name(self) -> ProcessName:
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from tbc_video_export.common.enums import ExportMode, TBCType
 
 
-@dataclass
+@dataclass(slots=True)
 class WrapperConfig(Generic[PipeInputGeneric, PipeOutputGeneric]):
     """Wrapper config class."""
 
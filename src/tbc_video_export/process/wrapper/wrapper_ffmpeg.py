@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from tbc_video_export.common import consts, exceptions
 from tbc_video_export.common.enums import (
@@ -14,10 +15,12 @@ from tbc_video_export.common.enums import (
     TBCType,
     VideoFormatType,
 )
-from tbc_video_export.common.utils import FlatList, ansi
+from tbc_video_export.common.utils import FlatList, ansi, files
 from tbc_video_export.process.wrapper.wrapper import Wrapper
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from tbc_video_export.config.profile import Profile, ProfileVideo
     from tbc_video_export.process.wrapper.pipe import Pipe
     from tbc_video_export.process.wrapper.wrapper import WrapperConfig
@@ -33,14 +36,24 @@ class WrapperFFmpeg(Wrapper):
         self._additional_vopts: FlatList = FlatList()
         self._hwaccel_opts: FlatList = FlatList()
         self._hwaccel_filter: str = ""
-        super().__init__(state, config)
+
+        self._state = state
         self._config = config
+
+        # hwaccel opts must be parsed before the command is built and cached
         self._parse_hwaccel()
 
+        super().__init__(state, config)
+        self._check_audio_tracks()
+
     def post_fn(self) -> None:  # noqa: D102
         pass
 
-    @property
+    def invalidate_command(self) -> None:  # noqa: D102
+        super().invalidate_command()
+        self.__dict__.pop("_existing_files", None)
+
+    @cached_property
     def command(self) -> FlatList:  # noqa: D102
         return FlatList(
             (
@@ -49,52 +62,48 @@ class WrapperFFmpeg(Wrapper):
                 self._get_misc_opts(),
                 self._get_hwaccel_opts(),
                 self._get_input_opts(),
-                self._get_filter_complex_opts(),
+                self._filter_complex_opts,
                 self._get_map_opts(),
                 self._get_timecode_opt(),
-                self._get_framerate_opt(),
-                self._get_color_opts(),
+                self._framerate_opt,
+                self._color_opts,
                 self._get_codec_opts(),
                 self._get_metadata_opts(),
                 self._get_output_opt(),
             )
         )
 
-    def _get_verbosity_opts(self) -> FlatList:
+    def _get_verbosity_opts(self) -> tuple[str, ...]:
         """Return opts for verbosity."""
-        verbosity_opts = FlatList("-hide_banner")
-
         # enable progress reporting if we are not displaying output
+        # progress is written to stderr, the same pipe used for errors, as
+        # newline terminated key=value lines, the regular stats line is carriage
+        # return terminated and cannot be read line by line
         if not self._state.opts.show_process_output:
-            verbosity_opts.append(
-                (
-                    "-loglevel",
-                    "error",
-                    "-progress",
-                    "pipe:2",
-                )
-            )
-        else:
-            verbosity_opts.append(("-loglevel", "verbose"))
+            return consts.FFMPEG_PROGRESS_OPTS
 
-        return verbosity_opts
+        return consts.FFMPEG_VERBOSE_OPTS
 
     def _get_misc_opts(self) -> FlatList:
         opts = FlatList((self._state.opts.convert_opt("overwrite", "-y"),))
 
-        thread_count = self._state.opts.threads
+        if self._thread_count != 0:
+            # filter complex threads are global, -threads is set on the output
+            opts.extend(("-filter_complex_threads", str(self._thread_count)))
 
-        if (t := self._state.opts.ffmpeg_threads) is not None:
-            thread_count = t
+        return opts
 
-        if thread_count != 0:
-            opts.append(("-threads", thread_count))
+    @cached_property
+    def _thread_count(self) -> int:
+        """Return thread count, 0 uses the FFmpeg defaults."""
+        if (t := self._state.opts.ffmpeg_threads) is not None:
+            return t
 
-        return opts
+        return self._state.opts.threads
 
     def _parse_hwaccel(self) -> None:
         """Parse hardware acceleration opts."""
-        match self._get_profile().video_profile.hardware_accel:
+        match self._video_profile.hardware_accel:
             case HardwareAccelType.VAAPI:
                 self._hwaccel_opts.append(
                     ("-hwaccel", "vaapi", "-hwaccel_output_format", "vaapi")
@@ -103,15 +112,32 @@ class WrapperFFmpeg(Wrapper):
                 if (hwaccel_device := self._state.opts.hwaccel_device) is not None:
                     self._hwaccel_opts.append(("-vaapi_device", hwaccel_device))
 
+                # inputs are raw frames from ld-chroma-decoder (or an FFV1 luma file
+                # in two-step mode), neither of which can be decoded by VAAPI, so
+                # frames are always in system memory and must be uploaded once for
+                # the encoder
                 self._hwaccel_filter = "hwupload"
 
             case HardwareAccelType.NVENC:
+                # -hwaccel cuda is not used as raw input frames cannot be decoded
+                # by CUDA, the encoder uploads system memory frames itself
                 if (hwaccel_device := self._state.opts.hwaccel_device) is not None:
                     self._additional_vopts.append(("-gpu", hwaccel_device))
 
+                self._additional_vopts.append(self._get_nvenc_low_latency_opts())
+
             case HardwareAccelType.QUICKSYNC:
+                qsv_device = "qsv=hw"
+
+                if (hwaccel_device := self._state.opts.hwaccel_device) is not None:
+                    qsv_device += f",child_device={hwaccel_device}"
+
                 self._hwaccel_opts.append(
                     (
+                        "-init_hw_device",
+                        qsv_device,
+                        "-filter_hw_device",
+                        "hw",
                         "-hwaccel",
                         "qsv",
                         "-hwaccel_output_format",
@@ -119,25 +145,64 @@ class WrapperFFmpeg(Wrapper):
                     )
                 )
 
-                if (hwaccel_device := self._state.opts.hwaccel_device) is not None:
-                    self._hwaccel_opts.append(("-qsv_device", hwaccel_device))
+                # upload frames to the qsv device so they stay on the gpu
+                self._hwaccel_filter = "hwupload=extra_hw_frames=64,format=qsv"
 
             case HardwareAccelType.AMF:
-                if self._state.opts.hwaccel_device is not None:
-                    raise exceptions.InvalidProfileError(
-                        "Unable to set device for AMD AMF encoding due to FFmpeg "
-                        "limitiations."
+                if (hwaccel_device := self._state.opts.hwaccel_device) is not None:
+                    # the AMF encoder uses an initialized d3d11va device if one
+                    # exists, this is not possible on other platforms
+                    if os.name != "nt":
+                        raise exceptions.InvalidProfileError(
+                            "Unable to set device for AMD AMF encoding on "
+                            f"{os.name} due to FFmpeg limitations."
+                        )
+
+                    self._hwaccel_opts.append(
+                        (
+                            "-init_hw_device",
+                            f"d3d11va=amf:{hwaccel_device}",
+                            "-filter_hw_device",
+                            "amf",
+                        )
                     )
 
+                    # upload frames to the selected device, otherwise the
+                    # encoder uploads them to its own default device
+                    self._hwaccel_filter = "hwupload=extra_hw_frames=64,format=d3d11"
+
             case _:
                 pass
 
+    def _get_nvenc_low_latency_opts(self) -> FlatList:
+        """Return opts for NVENC low-latency encoding."""
+        if not self._state.opts.low_latency:
+            return FlatList()
+
+        # start emitting packets without buffering frames
+        return FlatList(
+            (
+                "-delay",
+                "0",
+                "-zerolatency",
+                "1",
+                "-rc-lookahead",
+                "0",
+            )
+        )
+
     def _get_hwaccel_opts(self) -> FlatList:
         return self._hwaccel_opts
 
-    def _get_thread_queue_size_opt(self) -> FlatList:
-        """Return opts for thread queue size."""
-        return FlatList(("-thread_queue_size", str(self._state.opts.thread_queue_size)))
+    @cached_property
+    def _video_input_args(self) -> tuple[str, ...]:
+        """Return opts set before each video input."""
+        return (
+            "-thread_queue_size",
+            str(self._state.opts.thread_queue_size),
+            "-color_range",
+            self._state.video_system_data.ffmpeg_config.color_range,
+        )
 
     def _get_input_opts(self) -> FlatList:
         """Return opts for all inputs."""
@@ -165,7 +230,7 @@ class WrapperFFmpeg(Wrapper):
                     "-pix_fmt",
                     VideoFormatType.GRAY.value.get(16),
                     "-framerate",
-                    self._get_framerate(),
+                    self._framerate,
                     "-video_size",
                     f"{size.width}x{size.height}",
                 )
@@ -173,7 +238,7 @@ class WrapperFFmpeg(Wrapper):
 
         inputs: list[str] = []
 
-        if self._is_two_step_merge_mode():
+        if self._is_two_step_merge_mode:
             # add the luma file as an input
             inputs.append(str(self._state.file_helper.output_video_file_luma))
 
@@ -181,16 +246,10 @@ class WrapperFFmpeg(Wrapper):
         for i in self._config.input_pipes:
             inputs.append(str(i.in_path))
 
-        input_opts.append(
-            (
-                self._get_thread_queue_size_opt(),
-                "-color_range",
-                video_system_data.ffmpeg_config.color_range,
-                "-i",
-                i,
-            )
-            for i in inputs
-        )
+        input_args = self._video_input_args
+
+        for i in inputs:
+            input_opts.extend((*input_args, "-i", i))
 
         return input_opts
 
@@ -214,36 +273,40 @@ class WrapperFFmpeg(Wrapper):
 
             input_opts.append(("-i", track.file_name))
 
-            # if the track does not exist, we add a warning to the message log as
-            # the file may be generated by ld-process-efm and will exist by the time
-            # FFmpeg runs
-            # we should perhaps only init a wrapper when it is time to run?
-            if not Path(track.file_name).is_file():
+        return input_opts
+
+    def _check_audio_tracks(self) -> None:
+        """Add a warning to the message log for any missing audio tracks."""
+        # the file may be generated by ld-process-efm and will exist by the time
+        # FFmpeg runs
+        for track in self._state.opts.audio_track:
+            if Path(track.file_name) not in self._existing_files:
                 self._state.export.append_message(
                     ansi.error_color(
                         f"FFmpeg track {track.file_name} does not currently exist."
                     )
                 )
 
-        return input_opts
-
     def _get_metadata_input_opts(self) -> FlatList:
         """Return opts for metadata input."""
         input_opts = FlatList()
-        if self._state.opts.export_metadata:
+        opts = self._state.opts
+        file_helper = self._state.file_helper
+
+        if opts.export_metadata:
             # subtitles
-            if self._state.opts.dry_run:
+            if opts.dry_run:
                 input_opts.append(("{-i", "[SUBTITLE_FILE]}"))
-            elif (cc_file := self._state.file_helper.cc_file).is_file():
+            elif (cc_file := file_helper.cc_file) in self._existing_files:
                 input_opts.append(("-i", cc_file))
 
             # metadata
-            if self._state.opts.dry_run:
+            if opts.dry_run:
                 input_opts.append(("{-i", "[METADATA_FILE]}"))
-            elif (ffmetadata := self._state.file_helper.ffmetadata_file).is_file():
+            elif (ffmetadata := file_helper.ffmetadata_file) in self._existing_files:
                 input_opts.append(("-i", ffmetadata))
 
-        for ffmetadata in self._state.opts.metadata_file:
+        for ffmetadata in opts.metadata_file:
             input_opts.append(("-i", ffmetadata))
 
         return input_opts
@@ -253,27 +316,22 @@ class WrapperFFmpeg(Wrapper):
         video_filters: list[str] = []
         other_filters: list[str] = []
 
-        _vf, _of = self._state.config.get_profile_filters(self._get_profile())
+        _vf, _of = self._state.config.get_profile_filters(self._profile)
 
         # set video filters
         video_filters += _vf
 
-        if (arf := self._get_aspect_ratio_filter()) is not None:
+        if (arf := self._aspect_ratio_filter) is not None:
             video_filters.append(arf)
 
         # override profile colorlevels if set with opt
-        if self._state.opts.force_black_level is not None:
-            video_filters.append(
-                "colorlevels="
-                f"rimin={self._state.opts.force_black_level[0]}/255:"
-                f"gimin={self._state.opts.force_black_level[1]}/255:"
-                f"bimin={self._state.opts.force_black_level[2]}/255"
-            )
+        if (black_level := self._state.opts.force_black_level) is not None:
+            video_filters.append(consts.FFMPEG_COLORLEVELS_FILTER.format(*black_level))
 
         if self._state.opts.append_video_filter is not None:
             video_filters.append(self._state.opts.append_video_filter)
 
-        video_filters.append(f"format={self._get_profile_video_format()}")
+        video_filters.append(f"format={self._profile_video_format}")
 
         if self._state.opts.hwaccel_type is not None and self._hwaccel_filter:
             video_filters.append(self._hwaccel_filter)
@@ -286,94 +344,101 @@ class WrapperFFmpeg(Wrapper):
 
         return video_filters, other_filters
 
-    def _get_filter_complex_opts(self) -> FlatList:  # noqa: C901, PLR0912
-        """Return opts for filter complex."""
-        field_filter = f"setfield={self._get_field_order()}"
+    @cached_property
+    def _filter_complex_opts(self) -> FlatList:
+        """Return opts for filter complex.
+
+        The filters only depend on opts, profile and export mode, so this is
+        kept when the command is invalidated.
+        """
         video_filters, other_filters = self._get_filters()
 
         # add setfield to start of filters
-        video_filters.insert(0, field_filter)
+        video_filters.insert(0, self._field_filter)
 
-        video_filters_str = ",".join(video_filters)
-        other_filters_str = f",{of}" if (of := ",".join(other_filters)) else ""
+        other_filters_str = "," + ",".join(other_filters) if other_filters else ""
+        filters = ",".join(video_filters) + consts.FFMPEG_VIDEO_MAP + other_filters_str
 
-        match self._config.export_mode:
-            case ExportMode.CHROMA_MERGE:
-                # merge Y/C from separate Y+C inputs
+        build_filter_complex = self._FILTER_COMPLEX_BUILDERS.get(
+            self._config.export_mode, WrapperFFmpeg._build_default_filter_complex
+        )
 
-                # using mergeplanes 0x001112 with pipe+pipe input works but there
-                # seems to be an issue when merging gray16le and 16-bit yuv(??) formats.
-                # safer to extract the 2x inputs (file+pipe/pipe+pipe) into y/u/v planes
-                # and merge to avoid any issues.
+        return FlatList(("-filter_complex", build_filter_complex(self, filters)))
 
-                mergeplanes = (
-                    "0x001020"
-                    if consts.FFMPEG_USE_OLD_MERGEPLANES
-                    else "map1s=1:map2s=2"
-                )
+    def _build_chroma_merge_filter_complex(self, filters: str) -> str:
+        """Return filter complex to merge Y/C from separate Y+C inputs."""
+        luma_format = consts.FFMPEG_DEFAULT_LUMA_FORMAT
+        chroma_format = consts.FFMPEG_DEFAULT_CHROMA_FORMAT
 
-                complex_filter = (
-                    f"[0:v]format={consts.FFMPEG_DEFAULT_LUMA_FORMAT}[luma];"
-                    f"[1:v]format={consts.FFMPEG_DEFAULT_CHROMA_FORMAT}[chroma];"
-                    f"[luma]extractplanes=y[y];[chroma]extractplanes=u+v[u][v];"
-                    f"[y][u][v]mergeplanes={mergeplanes}:format={consts.FFMPEG_DEFAULT_CHROMA_FORMAT},"
-                )
+        # using mergeplanes 0x001112 with pipe+pipe input works but there
+        # seems to be an issue when merging gray16le and 16-bit yuv(??) formats.
+        # safer to extract the 2x inputs (file+pipe/pipe+pipe) into y/u/v planes
+        # and merge to avoid any issues.
+        return (
+            f"[0:v]format={luma_format}[luma];[1:v]format={chroma_format}[chroma];"
+            "[luma]extractplanes=y[y];[chroma]extractplanes=u+v[u][v];"
+            f"[y][u][v]mergeplanes=0x001020:format={chroma_format},{filters}"
+        )
 
-            case ExportMode.LUMA_EXTRACTED:
-                # extract Y from a Y/C input
-                complex_filter = "[0:v]extractplanes=y,"
+    def _build_luma_extracted_filter_complex(self, filters: str) -> str:
+        """Return filter complex to extract Y from a Y/C input."""
+        return f"[0:v]extractplanes=y,{filters}"
 
-            case ExportMode.LUMA_4FSC:
-                # interleve tbc fields
-                complex_filter = "[0:v]il=l=i:c=i,"
+    def _build_luma_4fsc_filter_complex(self, filters: str) -> str:
+        """Return filter complex to interleave tbc fields."""
+        return f"[0:v]il=l=i:c=i,{filters}"
 
-            case _:
-                complex_filter = "[0:v]"
+    def _build_luma_filter_complex(self, filters: str) -> str:
+        """Return filter complex for luma."""
+        # luma step in two-step should not use any filters (excluding setfield)
+        if self._is_two_step_luma_mode:
+            return f"[0:v]{self._field_filter}{consts.FFMPEG_VIDEO_MAP}"
 
-                # luma step in two-step should not use any filters (excluding setfield)
-                if self._is_two_step_luma_mode():
-                    video_filters_str = field_filter
-                    other_filters_str = ""
+        return self._build_default_filter_complex(filters)
 
-        return FlatList(
-            (
-                "-filter_complex",
-                complex_filter
-                + video_filters_str
-                + consts.FFMPEG_VIDEO_MAP
-                + other_filters_str,
-            )
-        )
+    def _build_default_filter_complex(self, filters: str) -> str:
+        """Return filter complex for a single input."""
+        return f"[0:v]{filters}"
+
+    _FILTER_COMPLEX_BUILDERS: ClassVar[
+        dict[ExportMode, Callable[[WrapperFFmpeg, str], str]]
+    ] = {
+        ExportMode.CHROMA_MERGE: _build_chroma_merge_filter_complex,
+        ExportMode.LUMA_EXTRACTED: _build_luma_extracted_filter_complex,
+        ExportMode.LUMA_4FSC: _build_luma_4fsc_filter_complex,
+        ExportMode.LUMA: _build_luma_filter_complex,
+    }
 
     def _get_map_opts(self) -> FlatList:
         """Return FFmpeg video map opts."""
         # video
+        opts = self._state.opts
+        file_helper = self._state.file_helper
+
         input_opts = FlatList(("-map", f"{consts.FFMPEG_VIDEO_MAP}"))
         input_count = len(self._config.input_pipes)
 
         # audio
-        input_opts.append(
-            ("-map", f"{i + input_count}:a")
-            for i in range(len(self._state.opts.audio_track))
-        )
-        input_count += len(self._state.opts.audio_track)
+        for i in range(len(opts.audio_track)):
+            input_opts.extend(("-map", f"{i + input_count}:a"))
+        input_count += len(opts.audio_track)
 
-        if self._state.opts.export_metadata:
+        if opts.export_metadata:
             # subtitles
-            if self._state.opts.dry_run:
+            if opts.dry_run:
                 input_opts.append(("{-map", "[SUBTITLE_INDEX]:s}"))
-            elif self._state.file_helper.cc_file.is_file():
+            elif file_helper.cc_file in self._existing_files:
                 input_opts.append(("-map", f"{input_count}:s"))
                 input_count += 1
 
             # metadata
-            if self._state.opts.dry_run:
+            if opts.dry_run:
                 input_opts.append(("{-map_metadata", "[METADATA_INDEX]}"))
-            elif self._state.file_helper.ffmetadata_file.is_file():
+            elif file_helper.ffmetadata_file in self._existing_files:
                 input_opts.append(("-map_metadata", input_count))
                 input_count += 1
 
-        for _ in self._state.opts.metadata_file:
+        for _ in opts.metadata_file:
             input_opts.append(("-map_metadata", input_count))
             input_count += 1
 
@@ -383,20 +448,18 @@ class WrapperFFmpeg(Wrapper):
         """Return opts for timecode."""
         return FlatList(("-timecode", self._state.file_helper.tbc_json.timecode))
 
-    def _get_framerate(self) -> str:
+    @cached_property
+    def _framerate(self) -> str:
         """Return rate based on video system."""
         return self._state.video_system_data.ffmpeg_config.fps
 
-    def _get_framerate_opt(self) -> FlatList:
+    @cached_property
+    def _framerate_opt(self) -> tuple[str, str]:
         """Return opts for rate."""
-        return FlatList(
-            (
-                "-framerate",
-                self._get_framerate(),
-            )
-        )
+        return ("-framerate", self._framerate)
 
-    def _get_aspect_ratio_filter(self) -> str | None:
+    @cached_property
+    def _aspect_ratio_filter(self) -> str | None:
         """Return filter for aspect ratios."""
         if self._state.is_widescreen:
             ar = self._state.video_system_data.aspect_ratio["widescreen"]
@@ -408,10 +471,13 @@ class WrapperFFmpeg(Wrapper):
 
         return None  # do not return default ar
 
-    def _get_color_opts(self) -> FlatList | None:
+    @cached_property
+    def _color_opts(self) -> FlatList:
         """Return opts for color settings."""
         ffmpeg_config = self._state.video_system_data.ffmpeg_config
 
+        # -color_range is also set per input, this is not a duplicate as the
+        # input opt tags the raw frames while this one tags the output stream
         return FlatList(
             (
                 "-color_range",
@@ -427,16 +493,24 @@ class WrapperFFmpeg(Wrapper):
 
     def _get_codec_opts(self) -> FlatList:
         """Return opts containing codecs for inputs."""
+        opts = self._state.opts
+        video_profile = self._video_profile
+
         codec_opts = FlatList(
             (
                 "-c:v",
-                self._get_profile().video_profile.codec,
-                self._get_profile().video_profile.opts,
+                video_profile.codec,
+                video_profile.opts,
                 self._additional_vopts,
             )
         )
 
-        if (audio_profile := self._get_profile().audio_profile) is not None:
+        # -threads before an input only applies to its decoder, it must be an
+        # output opt to apply to the encoders
+        if self._thread_count != 0:
+            codec_opts.extend(("-threads", str(self._thread_count)))
+
+        if (audio_profile := self._profile.audio_profile) is not None:
             codec_opts.append(
                 (
                     "-c:a",
@@ -445,23 +519,23 @@ class WrapperFFmpeg(Wrapper):
                 )
             )
 
-            if self._state.opts.export_metadata:
-                if self._state.opts.dry_run:
-                    codec_opts.append(("{-c:s", self._get_subtitle_format() + "}"))
-                elif (
-                    self._state.opts.export_metadata
-                    and self._state.file_helper.cc_file.is_file()
-                ):
-                    codec_opts.append(("-c:s", self._get_subtitle_format()))
+            # the cc file is scc (eia-608) which cannot be stream copied into any
+            # supported container, it must always be converted
+            if opts.export_metadata:
+                if opts.dry_run:
+                    codec_opts.append(("{-c:s", self._subtitle_format + "}"))
+                elif self._state.file_helper.cc_file in self._existing_files:
+                    codec_opts.append(("-c:s", self._subtitle_format))
 
         return codec_opts
 
     def _get_metadata_opts(self) -> FlatList:
         """Return opts for metadata."""
         # custom metadata
-        metadata_opts = FlatList(
-            ("-metadata", f"{data[0]}={data[1]}") for data in self._state.opts.metadata
-        )
+        metadata_opts = FlatList()
+
+        for data in self._state.opts.metadata:
+            metadata_opts.extend(("-metadata", f"{data[0]}={data[1]}"))
 
         # audio
         for idx, track in enumerate(self._state.opts.audio_track):
@@ -475,7 +549,7 @@ class WrapperFFmpeg(Wrapper):
                 metadata_opts.append((f"-channel_layout:a:{idx}", f"{layout}"))
 
         # attachment
-        if self._get_supports_attachments() and not self._state.opts.no_attach_json:
+        if self._supports_attachments and not self._state.opts.no_attach_json:
             metadata_opts.append(
                 (
                     "-attach",
@@ -491,13 +565,13 @@ class WrapperFFmpeg(Wrapper):
         """Output opts for ffmpeg."""
         output_file = (
             self._state.file_helper.output_video_file_luma
-            if self._is_two_step_luma_mode()
+            if self._is_two_step_luma_mode
             else self._state.file_helper.output_video_file
         )
 
         # only set if the user has not manually specified a container
         output_format = (
-            self._get_profile().video_profile.output_format
+            self._video_profile.output_format
             if not self._state.opts.profile_container
             else None
         )
@@ -523,20 +597,36 @@ class WrapperFFmpeg(Wrapper):
             else FlatList(output_file)
         )
 
-    def _get_profile(self) -> Profile:
+    @cached_property
+    def _existing_files(self) -> set[Path]:
+        """Return the input files used by FFmpeg that currently exist."""
+        file_helper = self._state.file_helper
+
+        return files.get_existing_files(
+            (
+                file_helper.cc_file,
+                file_helper.ffmetadata_file,
+                *(Path(track.file_name) for track in self._state.opts.audio_track),
+            )
+        )
+
+    @cached_property
+    def _profile(self) -> Profile:
         """Return the profile in state."""
         return self._state.profile
 
-    def _get_video_profile(self) -> ProfileVideo:
+    @cached_property
+    def _video_profile(self) -> ProfileVideo:
         """Return the video profile in state."""
-        return self._state.profile.video_profile
+        return self._profile.video_profile
 
-    def _get_profile_video_format(self) -> str:
+    @cached_property
+    def _profile_video_format(self) -> str:
         """Return the video format in state."""
-        video_format = self._get_profile().video_profile.video_format
+        video_format = self._video_profile.video_format
 
         # if two step, set to gray8/16le
-        if self._is_two_step_luma_mode() or self._config.export_mode in (
+        if self._is_two_step_luma_mode or self._config.export_mode in (
             ExportMode.LUMA,
             ExportMode.LUMA_4FSC,
             ExportMode.LUMA_EXTRACTED,
@@ -562,16 +652,18 @@ class WrapperFFmpeg(Wrapper):
             (vf := self._state.opts.video_format) is not None
             and (depth := self._state.opts.video_bitdepth) is not None
             and (new_format := vf.value.get(depth)) is not None
-            and not self._is_two_step_luma_mode()
+            and not self._is_two_step_luma_mode
         ):
             video_format = new_format
 
         return video_format
 
+    @cached_property
     def _is_two_step_luma_mode(self) -> bool:
         """Return True if this wrapper is in luma mode while two-step is enabled."""
         return self._state.opts.two_step and self._config.export_mode is ExportMode.LUMA
 
+    @cached_property
     def _is_two_step_merge_mode(self) -> bool:
         """Return True if this wrapper is in merge mode while two-step is enabled."""
         return (
@@ -579,11 +671,13 @@ class WrapperFFmpeg(Wrapper):
             and self._config.export_mode is ExportMode.CHROMA_MERGE
         )
 
-    def _get_supports_attachments(self) -> bool:
+    @cached_property
+    def _supports_attachments(self) -> bool:
         """Return True if attachments are supported by the profile container."""
         return self._state.file_helper.output_container.lower() == "mkv"
 
-    def _get_subtitle_format(self) -> str:
+    @cached_property
+    def _subtitle_format(self) -> str:
         """Return subtitle format based on the profile container."""
         return (
             "srt"
@@ -591,10 +685,16 @@ class WrapperFFmpeg(Wrapper):
             else "mov_text"
         )
 
-    def _get_field_order(self) -> str:
+    @cached_property
+    def _field_order(self) -> str:
         """Return the formatted field order from opts."""
         return self._state.opts.field_order.name.lower()
 
+    @cached_property
+    def _field_filter(self) -> str:
+        """Return the setfield filter for the field order."""
+        return f"setfield={self._field_order}"
+
     @cached_property
     def process_name(self) -> ProcessName:  # noqa: D102
         return ProcessName.FFMPEG
@@ -604,9 +704,8 @@ class WrapperFFmpeg(Wrapper):
         return PipeType.NULL | PipeType.OS | PipeType.NAMED
 
     @cached_property
-    def stdin(self) -> int | None:  # noqa: D102
-        # if ffmpeg has a pipe with a handle, use it
-        # we usually use named pipes that do not have handles
+    def _first_input_handle(self) -> int | None:
+        """Return the first input pipe handle, if any."""
         return next(
             (
                 pipe.in_handle
@@ -616,18 +715,17 @@ class WrapperFFmpeg(Wrapper):
             None,
         )
 
+    @cached_property
+    def stdin(self) -> int | None:  # noqa: D102
+        # if ffmpeg has a pipe with a handle, use it
+        # we usually use named pipes that do not have handles
+        return self._first_input_handle
+
     @cached_property
     def stdout(self) -> int | None:  # noqa: D102
         # if ffmpeg has a pipe with a handle, use it
         # we usually do not have any out pipes
-        return next(
-            (
-                pipe.in_handle
-                for pipe in self._config.input_pipes
-                if pipe.in_handle is not None
-            ),
-            None,
-        )
+        return self._first_input_handle
 
     @cached_property
     def stderr(self) -> int | None:  # noqa: D102
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from functools import partial
 from typing import TYPE_CHECKING
 
 from tbc_video_export.common import exceptions
@@ -41,6 +40,10 @@ class WrapperGroup:
 
     This is based on requested procs, tbc type and export mode.
     These groups are used to run procs in "order", as some procs must run before others.
+
+    All procs in a group are started together and connected by pipes, wrappers are
+    created in pipe order (dropout correct -> chroma decoder -> ffmpeg) so a pipe
+    always exists before the wrapper consuming it is created.
     """
 
     def __init__(
@@ -57,12 +60,7 @@ class WrapperGroup:
 
         self.wrappers: list[Wrapper] = []
         self.consumable_pipes: list[ConsumablePipe] = []
-
-        self._create_pipe_config = partial(
-            PipeFactoryConfig,
-            async_nt_pipes=self._state.opts.async_nt_pipes,
-            force_dummy=self._state.dry_run,
-        )
+        self._pipes_by_consumer: dict[ProcessName, list[ConsumablePipe]] = {}
 
         logging.getLogger("console").debug(
             f"Creating wrappers for {FlagHelper.get_flags_str(process_names, '+')}"
@@ -77,6 +75,15 @@ class WrapperGroup:
         """Return export mode for the wrapper group."""
         return self._export_mode
 
+    def invalidate_commands(self) -> None:
+        """Discard cached wrapper commands.
+
+        This should be called when previous groups have run, as they may create
+        files or modify state used by the wrappers in this group.
+        """
+        for wrapper in self.wrappers:
+            wrapper.invalidate_command()
+
     def _create_standalone_wrappers(
         self,
     ) -> None:
@@ -104,18 +111,14 @@ class WrapperGroup:
             return
 
         for tbc_type in FlagHelper.get_flags(self._tbc_types):
-            create_pipe_config = partial(self._create_pipe_config, tbc_type=tbc_type)
-
             if ProcessName.LD_DROPOUT_CORRECT in self._process_names:
                 # create dropout correction -> decoder pipe
-                self.consumable_pipes.append(
+                self._add_consumable_pipe(
                     ConsumablePipe(
                         tbc_type,
                         ProcessName.LD_CHROMA_DECODER,
-                        pipe := PipeFactory.create(
-                            create_pipe_config(
-                                PipeType.OS, ProcessName.LD_DROPOUT_CORRECT
-                            )
+                        pipe := self._create_pipe(
+                            PipeType.OS, ProcessName.LD_DROPOUT_CORRECT, tbc_type
                         ),
                     )
                 )
@@ -136,7 +139,7 @@ class WrapperGroup:
                 ):
                     # if no pipes have been created for chroma-decoder, create a
                     # dummy pipe with the tbc file name
-                    self.consumable_pipes.append(
+                    self._add_consumable_pipe(
                         ConsumablePipe(
                             tbc_type,
                             ProcessName.LD_CHROMA_DECODER,
@@ -147,17 +150,16 @@ class WrapperGroup:
                     )
 
                 # create decoder -> ffmpeg pipe
-                self.consumable_pipes.append(
+                self._add_consumable_pipe(
                     ConsumablePipe(
                         tbc_type,
                         ProcessName.FFMPEG,
-                        pipe := PipeFactory.create(
-                            create_pipe_config(
-                                PipeType.OS
-                                if self._state.opts.two_step
-                                else PipeType.NAMED,
-                                ProcessName.LD_CHROMA_DECODER,
-                            )
+                        pipe := self._create_pipe(
+                            PipeType.OS
+                            if self._state.opts.two_step
+                            else PipeType.NAMED,
+                            ProcessName.LD_CHROMA_DECODER,
+                            tbc_type,
                         ),
                     )
                 )
@@ -183,7 +185,7 @@ class WrapperGroup:
             # check if any pipes created for ffmpeg, if not create
             # a dummy pipe  using the tbc file name
             if not self._get_pipes_for_consumer(ProcessName.FFMPEG, self._tbc_types):
-                self.consumable_pipes.append(
+                self._add_consumable_pipe(
                     ConsumablePipe(
                         self._tbc_types,
                         ProcessName.FFMPEG,
@@ -206,25 +208,57 @@ class WrapperGroup:
                 )
             )
 
+    def _create_pipe(
+        self, pipe_type: PipeType, process_name: ProcessName, tbc_type: TBCType
+    ) -> Pipe:
+        """Create a pipe for a producer/wrapper."""
+        return PipeFactory.create(
+            PipeFactoryConfig(
+                pipe_type,
+                process_name,
+                tbc_type,
+                force_dummy=self._state.dry_run,
+                async_nt_pipes=self._state.opts.async_nt_pipes,
+            )
+        )
+
+    def _add_consumable_pipe(self, consumable_pipe: ConsumablePipe) -> None:
+        """Add a pipe to be used by a consumer/wrapper."""
+        self.consumable_pipes.append(consumable_pipe)
+        self._pipes_by_consumer.setdefault(consumable_pipe.consumer, []).append(
+            consumable_pipe
+        )
+
     def _get_pipes_for_consumer(
         self, consumer_name: ProcessName, tbc_types: TBCType
     ) -> tuple[Pipe, ...]:
         """Get pipes created for a consumer/wrapper."""
-        pipes = tuple(
-            group.pipe
-            for group in self.consumable_pipes
-            if group.consumer == consumer_name and group.tbc_type in tbc_types
-        )
+        pipes: list[Pipe] = []
+        os_pipe_count = 0
+
+        for group in self._pipes_by_consumer.get(consumer_name, ()):
+            if group.tbc_type in tbc_types:
+                pipes.append(group.pipe)
+
+                if group.pipe.pipe_type is PipeType.OS:
+                    os_pipe_count += 1
+
         # ensure we do not have multiple os stdio pipes
-        if sum(1 for pipe in pipes if pipe.pipe_type is PipeType.OS) > 1:
+        if os_pipe_count > 1:
             raise exceptions.PipeError(
                 f"Multiple {PipeType.OS} pipes are not supported."
             )
 
-        return pipes
+        return tuple(pipes)
 
     def _get_pipe_for_consumer(
         self, consumer_name: ProcessName, tbc_types: TBCType
     ) -> Pipe:
         """Get single pipe created for a consumer/wrapper."""
-        return next(iter(self._get_pipes_for_consumer(consumer_name, tbc_types)))
+        if not (pipes := self._get_pipes_for_consumer(consumer_name, tbc_types)):
+            raise exceptions.PipeError(
+                f"No pipe created for {consumer_name} "
+                f"({FlagHelper.get_flags_str(tbc_types)})."
+            )
+
+        return pipes[0]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from tbc_video_export.common import exceptions
 from tbc_video_export.common.enums import (
@@ -24,6 +24,56 @@ if TYPE_CHECKING:
 class WrapperLDChromaDecoder(Wrapper):
     """Wrapper for ld-tools-decoder."""
 
+    # program opt name, ld-chroma-decoder opt name
+    _CHROMA_OPTS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("chroma_gain", "--chroma-gain"),
+        ("chroma_nr", "--chroma-nr"),
+        ("chroma_phase", "--chroma-phase"),
+    )
+
+    _MISC_OPTS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("start", "-s"),
+        ("length", "-l"),
+        ("reverse", "-r"),
+        ("oftest", "-o"),
+        ("simple_pal", "--simple-pal"),
+        ("transform_threshold", "--transform-threshold"),
+        ("transform_thresholds", "--transform-thresholds"),
+    )
+
+    _ACTIVE_LINE_OPTS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("first_active_field_line", "--ffll"),
+        ("last_active_field_line", "--lfll"),
+        ("first_active_frame_line", "--ffrl"),
+        ("last_active_frame_line", "--lfrl"),
+    )
+
+    # valid decoders for each video system
+    _PAL_DECODERS: ClassVar[frozenset[ChromaDecoder]] = frozenset(
+        {
+            ChromaDecoder.MONO,
+            ChromaDecoder.PAL2D,
+            ChromaDecoder.TRANSFORM2D,
+            ChromaDecoder.TRANSFORM3D,
+        }
+    )
+
+    _NTSC_DECODERS: ClassVar[frozenset[ChromaDecoder]] = frozenset(
+        {
+            ChromaDecoder.MONO,
+            ChromaDecoder.NTSC1D,
+            ChromaDecoder.NTSC2D,
+            ChromaDecoder.NTSC3D,
+            ChromaDecoder.NTSC3DNOADAPT,
+        }
+    )
+
+    _VALID_DECODERS: ClassVar[dict[VideoSystem, frozenset[ChromaDecoder]]] = {
+        VideoSystem.PAL: _PAL_DECODERS,
+        VideoSystem.PAL_M: _PAL_DECODERS,
+        VideoSystem.NTSC: _NTSC_DECODERS,
+    }
+
     def __init__(self, state: ProgramState, config: WrapperConfig[Pipe, Pipe]) -> None:
         super().__init__(state, config)
         self._config = config
@@ -31,18 +81,18 @@ class WrapperLDChromaDecoder(Wrapper):
     def post_fn(self) -> None:  # noqa: D102
         pass
 
-    @property
+    @cached_property
     def command(self) -> FlatList:  # noqa: D102
         return FlatList(
             (
                 self.binary,
-                self._get_gain_nr_opts(),
+                self._gain_nr_opts,
                 "-p",
                 "y4m",
-                self._get_decoder_opts(),
-                self._get_active_line_opts(),
-                self._get_padding_opt(),
-                self._get_misc_opts(),
+                self._decoder_opts,
+                self._active_line_opts,
+                self._padding_opt,
+                self._misc_opts,
                 "--input-json",
                 self._state.file_helper.tbc_json.file_name,
                 self._config.input_pipes.in_path,
@@ -50,21 +100,18 @@ class WrapperLDChromaDecoder(Wrapper):
             )
         )
 
-    def _get_gain_nr_opts(self) -> FlatList:
+    @cached_property
+    def _gain_nr_opts(self) -> FlatList:
         """Return ld-chroma-decoder opts."""
         gain_nr_opts = FlatList()
+        convert_opt = self._state.opts.convert_opt
 
         if self._config.tbc_type in (TBCType.LUMA, TBCType.COMBINED):
-            gain_nr_opts.append(self._state.opts.convert_opt("luma_nr", "--luma-nr"))
+            gain_nr_opts.append(convert_opt("luma_nr", "--luma-nr"))
 
         if self._config.tbc_type in (TBCType.CHROMA, TBCType.COMBINED):
-            gain_nr_opts.append(
-                (
-                    self._state.opts.convert_opt("chroma_gain", "--chroma-gain"),
-                    self._state.opts.convert_opt("chroma_nr", "--chroma-nr"),
-                    self._state.opts.convert_opt("chroma_phase", "--chroma-phase"),
-                )
-            )
+            for opt_name, target_opt_name in self._CHROMA_OPTS:
+                gain_nr_opts.append(convert_opt(opt_name, target_opt_name))
 
         # set defaults for separated TBC
         if self._config.tbc_type is TBCType.LUMA:
@@ -76,65 +123,36 @@ class WrapperLDChromaDecoder(Wrapper):
 
         return gain_nr_opts
 
-    def _get_decoder_opts(self) -> FlatList:
+    @cached_property
+    def _decoder_opts(self) -> FlatList:
         """Return decoder to use."""
         # validate decoders for video system
+        video_system = self._state.video_system
         decoder = (
             self._state.decoder_chroma
             if self.tbc_type is not TBCType.LUMA
             else self._state.decoder_luma
         )
 
-        match self._state.video_system:
-            case VideoSystem.PAL | VideoSystem.PAL_M:
-                if decoder not in {
-                    ChromaDecoder.MONO,
-                    ChromaDecoder.PAL2D,
-                    ChromaDecoder.TRANSFORM2D,
-                    ChromaDecoder.TRANSFORM3D,
-                }:
-                    raise exceptions.InvalidChromaDecoderError(
-                        f"{decoder} is not a valid decoder for "
-                        f"{self._state.video_system}."
-                    )
-
-            case VideoSystem.NTSC:
-                if decoder not in {
-                    ChromaDecoder.MONO,
-                    ChromaDecoder.NTSC1D,
-                    ChromaDecoder.NTSC2D,
-                    ChromaDecoder.NTSC3D,
-                    ChromaDecoder.NTSC3DNOADAPT,
-                }:
-                    raise exceptions.InvalidChromaDecoderError(
-                        f"{decoder} is not a valid decoder for "
-                        f"{self._state.video_system}."
-                    )
-
-        return FlatList(
-            (
-                "-f",
-                self._state.decoder_luma.value
-                if self.tbc_type is TBCType.LUMA
-                else self._state.decoder_chroma.value,
+        if decoder not in self._VALID_DECODERS[video_system]:
+            raise exceptions.InvalidChromaDecoderError(
+                f"{decoder} is not a valid decoder for {video_system}."
             )
-        )
 
-    def _get_active_line_opts(self) -> FlatList | None:
+        return FlatList(("-f", decoder.value))
+
+    @cached_property
+    def _active_line_opts(self) -> FlatList | None:
         """Return active line opts."""
         video_system_data = self._state.video_system_data
         opts = self._state.opts
 
         # return user values if set
-        if self._state.opts.contains_active_line_opts():
-            return FlatList(
-                (
-                    opts.convert_opt("first_active_field_line", "--ffll"),
-                    opts.convert_opt("last_active_field_line", "--lfll"),
-                    opts.convert_opt("first_active_frame_line", "--ffrl"),
-                    opts.convert_opt("last_active_frame_line", "--lfrl"),
-                ),
-            )
+        if active_line_opts := FlatList(
+            opts.convert_opt(opt_name, target_opt_name)
+            for opt_name, target_opt_name in self._ACTIVE_LINE_OPTS
+        ):
+            return active_line_opts
 
         # return static active line values if non default export mode
         if self._state.decoder_line_preset != video_system_data.active_lines["default"]:
@@ -155,53 +173,43 @@ class WrapperLDChromaDecoder(Wrapper):
 
         return None
 
-    def _get_padding_opt(self) -> FlatList | None:
+    @cached_property
+    def _padding_opt(self) -> FlatList | None:
         """Return padding opt."""
         opts = self._state.opts
 
         if opts.output_padding is not None:
-            return FlatList(self._state.opts.convert_opt("output_padding", "--pad"))
+            return FlatList(opts.convert_opt("output_padding", "--pad"))
 
         if (padding := self._state.decoder_line_preset.padding) is not None:
             return FlatList(("--pad", padding))
 
         return None
 
-    def _get_misc_opts(self) -> FlatList:
+    @cached_property
+    def _misc_opts(self) -> FlatList:
         """Return ld-chroma-decoder opts."""
         decoder_opts = FlatList()
+        opts = self._state.opts
 
-        thread_count = self._state.opts.threads
+        thread_count = opts.threads
 
-        if (t := self._state.opts.decoder_threads) is not None:
+        if (t := opts.decoder_threads) is not None:
             thread_count = t
 
         if thread_count != 0:
-            decoder_opts.append(("-t", thread_count))
+            decoder_opts.extend(("-t", str(thread_count)))
 
-        decoder_opts.append(
-            (
-                self._state.opts.convert_opt("start", "-s"),
-                self._state.opts.convert_opt("length", "-l"),
-                self._state.opts.convert_opt("reverse", "-r"),
-                self._state.opts.convert_opt("oftest", "-o"),
-                self._state.opts.convert_opt("simple_pal", "--simple-pal"),
-                self._state.opts.convert_opt(
-                    "transform_threshold", "--transform-threshold"
-                ),
-                self._state.opts.convert_opt(
-                    "transform_thresholds", "--transform-thresholds"
-                ),
-            ),
-        )
+        for opt_name, target_opt_name in self._MISC_OPTS:
+            decoder_opts.append(opts.convert_opt(opt_name, target_opt_name))
 
         if self._state.video_system is VideoSystem.NTSC:
             # True unless ld detected
             add_phase_check = not self._state.file_helper.is_combined_ld
 
             # override if user has set
-            if self._state.opts.ntsc_phase_comp is not None:
-                add_phase_check = self._state.opts.ntsc_phase_comp
+            if opts.ntsc_phase_comp is not None:
+                add_phase_check = opts.ntsc_phase_comp
 
             if add_phase_check:
                 decoder_opts.append("--ntsc-phase-comp")
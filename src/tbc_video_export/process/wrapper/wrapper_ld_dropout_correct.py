@@ -25,12 +25,12 @@ class WrapperLDDropoutCorrect(Wrapper):
     def post_fn(self) -> None:  # noqa: D102
         pass
 
-    @property
+    @cached_property
     def command(self) -> FlatList:  # noqa: D102
         return FlatList(
             (
                 self.binary,
-                self._get_thread_opts(),
+                self._thread_opts,
                 "-i",
                 self._state.file_helper.tbcs[self._config.tbc_type],
                 "--input-json",
@@ -41,10 +41,13 @@ class WrapperLDDropoutCorrect(Wrapper):
             )
         )
 
-    def _get_thread_opts(self) -> FlatList | None:
-        thread_count = self._state.opts.threads
+    @cached_property
+    def _thread_opts(self) -> FlatList | None:
+        """Return thread opts."""
+        opts = self._state.opts
+        thread_count = opts.threads
 
-        if (t := self._state.opts.dropout_correct_threads) is not None:
+        if (t := opts.dropout_correct_threads) is not None:
             thread_count = t
 
         if thread_count != 0:
@@ -23,7 +23,7 @@ class WrapperLDExportMetadata(Wrapper):
     def post_fn(self) -> None:  # noqa: D102
         pass
 
-    @property
+    @cached_property
     def command(self) -> FlatList:  # noqa: D102
         return FlatList(
             (
@@ -26,7 +26,7 @@ class WrapperLDProcessEFM(Wrapper):
     def post_fn(self) -> None:  # noqa: D102
         pass
 
-    @property
+    @cached_property
     def command(self) -> FlatList:  # noqa: D102
         return FlatList(
             (
@@ -31,31 +31,33 @@ class WrapperLDProcessVBI(Wrapper):
             # load the new tbc json
             self._state.file_helper.tbc_json = self._tbc_json_vbi
 
-    @property
+    @cached_property
     def command(self) -> FlatList:  # noqa: D102
         return FlatList(
             (
                 self.binary,
-                self._get_thread_opts(),
+                self._thread_opts,
                 "--input-json",
                 self._state.file_helper.tbc_json.file_name,
                 "--output-json",
                 self._tbc_json_vbi,
-                self._get_tbc(),
+                self._tbc,
             ),
         )
 
-    def _get_tbc(self) -> Path:
-        return (
-            self._state.file_helper.tbcs[TBCType.LUMA]
-            if TBCType.LUMA in self._state.file_helper.tbcs
-            else self._state.file_helper.tbcs[TBCType.COMBINED]
-        )
+    @cached_property
+    def _tbc(self) -> Path:
+        """Return the luma or combined TBC."""
+        tbcs = self._state.file_helper.tbcs
+        return tbcs.get(TBCType.LUMA) or tbcs[TBCType.COMBINED]
 
-    def _get_thread_opts(self) -> FlatList | None:
-        thread_count = self._state.opts.threads
+    @cached_property
+    def _thread_opts(self) -> FlatList | None:
+        """Return thread opts."""
+        opts = self._state.opts
+        thread_count = opts.threads
 
-        if (t := self._state.opts.process_vbi_threads) is not None:
+        if (t := opts.process_vbi_threads) is not None:
             thread_count = t
 
         if thread_count != 0:
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from functools import cached_property
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar
 
 from tbc_video_export.common import VideoSystemData, consts, exceptions
 from tbc_video_export.common.enums import (
     ChromaDecoder,
     ExportMode,
-    FlagHelper,
     TBCType,
     VideoSystem,
 )
 from tbc_video_export.common.utils import ansi
+from tbc_video_export.common.utils.cached_property import cached_property
 from tbc_video_export.config.config import GetProfileFilter
 from tbc_video_export.process.parser.export_state import ExportState
 
@@ -32,7 +31,25 @@ class ProgramState:
     opts: Opts
     config: Config
     file_helper: FileHelper
-    export = ExportState()
+    export: ExportState = field(default_factory=ExportState)
+
+    # tbc types for s-video
+    _SVIDEO_TBC_TYPES: ClassVar[TBCType] = TBCType.LUMA | TBCType.CHROMA
+
+    # template for __str__, with fixed column widths
+    _STR_FMT: ClassVar[str] = (
+        "{k_input:<32s} {input}\n"
+        "{k_output:<32s} {output}\n"
+        "{k_log:<32s} {log}\n\n"
+        "{k_video_system:<32s} {video_system:<7s}"
+        "{k_tbc_type:<31s} {tbc_type:<17s}"
+        "{k_decoders:<33s} {decoders:<50s}\n"
+        "{k_fields:<32s} {fields:<7d}"
+        "{k_frames:<31s} {frames:<17d}"
+        "{k_export_mode:<33s} {export_mode} {two_step:<50s}\n\n"
+        "{k_profile:<32s} {profile}\n"
+        "{k_frame_type:<32s} {frame_type}\n\n"
+    )
 
     @property
     def current_export_mode(self) -> ExportMode:
@@ -167,7 +184,7 @@ class ProgramState:
         """Whether the program will execute the procs or just print them."""
         return self.opts.dry_run
 
-    @property
+    @cached_property
     def profile(self) -> Profile:
         """Return selected profile."""
         return self.config.get_profile(
@@ -191,8 +208,17 @@ class ProgramState:
 
         return min(tbc_frame_count - start, max(0, length))
 
-    def __str__(self) -> str:
-        """Return formatted string of program state."""
+    @cached_property
+    def _tbc_type_str(self) -> str:
+        """Return formatted TBC type."""
+        if self.tbc_types & self._SVIDEO_TBC_TYPES == self._SVIDEO_TBC_TYPES:
+            return "S-Video (Y+C)"
+
+        return "Composite (CVBS)"
+
+    @cached_property
+    def _log_files_str(self) -> str:
+        """Return formatted log file names."""
         log_files: list[str] = []
 
         if self.opts.log_process_output:
@@ -201,8 +227,30 @@ class ProgramState:
         if self.opts.debug:
             log_files.append(f"{consts.CURRENT_TIMESTAMP}_debug.log")
 
-        log_files_str = "Disabled" if not log_files else ", ".join(log_files)
+        return "Disabled" if not log_files else ", ".join(log_files)
+
+    @cached_property
+    def _output_files_str(self) -> str:
+        """Return formatted output file names."""
+        output_file: list[str] = []
+
+        if self.opts.two_step:
+            output_file.append(str(self.file_helper.output_video_file_luma))
+
+        output_file.append(str(self.file_helper.output_video_file))
+
+        return ", ".join(output_file)
+
+    @cached_property
+    def _profiles_str(self) -> str:
+        """Return formatted profile names."""
+        return (
+            f"{self.profile.name} "
+            f"{'[external]' if self.config.get_config_file() is not None else ''}"
+        )
 
+    def __str__(self) -> str:
+        """Return formatted string of program state."""
         match self.current_export_mode:
             case ExportMode.CHROMA_MERGE:
                 decoders = f"{self.decoder_luma} + {self.decoder_chroma}"
@@ -224,61 +272,28 @@ class ProgramState:
                 decoders = f"{self.decoder_luma}"
                 export_mode = "Luma"
 
-        if all(
-            t in FlagHelper.get_flags(self.tbc_types)
-            for t in (TBCType.LUMA, TBCType.CHROMA)
-        ):
-            tbc_type = "S-Video (Y+C)"
-        else:
-            tbc_type = "Composite (CVBS)"
-
-        two_step_mode_str = "(two-step)" if self.opts.two_step else ""
-
-        output_file: list[str] = []
-        profile: list[str] = []
-
-        if self.opts.two_step:
-            output_file.append(str(self.file_helper.output_video_file_luma))
-
-        output_file.append(str(self.file_helper.output_video_file))
-        profile.append(f"{self.profile.name}")
-
-        output_files = ", ".join(output_file)
-        profiles = (
-            f"{', '.join(profile)} "
-            f"{'[external]' if self.config.get_config_file() is not None else ''}"
-        )
-
-        col_w: dict[str, int] = {
-            "k1": 32,
-            "v1": 7,
-            "k2": 31,
-            "v2": 17,
-            "k3": 33,
-            "v3": 50,
-        }
-
-        return (
-            f"{ansi.dim('Input TBC:'):<{col_w['k1']}s} "
-            f"{self.file_helper.tbc_luma}\n"
-            f"{ansi.dim('Output Files:'):<{col_w['k1']}s} "
-            f"{output_files}\n"
-            f"{ansi.dim('Log Files:'):<{col_w['k1']}s} "
-            f"{log_files_str}\n\n"
-            f"{ansi.dim('Video System:'):<{col_w['k1']}s} "
-            f"{str(self.video_system).upper():<{col_w['v1']}s}"
-            f"{ansi.dim('TBC Type:'):<{col_w['k2']}s} "
-            f"{tbc_type:<{col_w['v2']}s}"
-            f"{ansi.dim('Chroma Decoder:'):<{col_w['k3']}s} "
-            f"{decoders:<{col_w['v3']}s}\n"
-            f"{ansi.dim('Total Fields:'):<{col_w['k1']}s} "
-            f"{self.tbc_json.field_count:<{col_w['v1']}d}"
-            f"{ansi.dim('Total Frames:'):<{col_w['k2']}s} "
-            f"{self.total_frames:<{col_w['v2']}d}"
-            f"{ansi.dim('Export Mode:'):<{col_w['k3']}s} "
-            f"{export_mode} {two_step_mode_str:<{col_w['v3']}s}\n\n"
-            f"{ansi.dim('Profile:'):<{col_w['k1']}s} "
-            f"{profiles}\n"
-            f"{ansi.dim('Frame Type:'):<{col_w['k1']}s} "
-            f"{self.opts.field_order}\n\n"
+        return self._STR_FMT.format(
+            k_input=ansi.dim("Input TBC:"),
+            input=str(self.file_helper.tbc_luma),
+            k_output=ansi.dim("Output Files:"),
+            output=self._output_files_str,
+            k_log=ansi.dim("Log Files:"),
+            log=self._log_files_str,
+            k_video_system=ansi.dim("Video System:"),
+            video_system=str(self.video_system).upper(),
+            k_tbc_type=ansi.dim("TBC Type:"),
+            tbc_type=self._tbc_type_str,
+            k_decoders=ansi.dim("Chroma Decoder:"),
+            decoders=decoders,
+            k_fields=ansi.dim("Total Fields:"),
+            fields=self.tbc_json.field_count,
+            k_frames=ansi.dim("Total Frames:"),
+            frames=self.total_frames,
+            k_export_mode=ansi.dim("Export Mode:"),
+            export_mode=export_mode,
+            two_step="(two-step)" if self.opts.two_step else "",
+            k_profile=ansi.dim("Profile:"),
+            profile=self._profiles_str,
+            k_frame_type=ansi.dim("Frame Type:"),
+            frame_type=self.opts.field_order,
         )
@@ -24,10 +24,18 @@ from tbc_video_export.process.wrapper.wrapper_ld_process_vbi import WrapperLDPro
 from tbc_video_export.program_state import ProgramState
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from pytest_mock import MockFixture
 
 
-@dataclass
+_FILES_DIR = (Path(__file__).parent / "files").absolute()
+
+# dummy pipes hold no state, so wrappers can share one
+_DUMMY_PIPE = PipeFactory.create_dummy_pipe()
+
+
+@dataclass(slots=True, frozen=True)
 class WrapperTestCase:  # noqa: D101
     id: str  # noqa: A003
     input_opts: list[str]
@@ -35,14 +43,14 @@ class WrapperTestCase:  # noqa: D101
     out_file: str | None = "out_file"
     tbc_type: TBCType = TBCType.NONE
     export_mode: ExportMode | None = None
-    expected_opts: list[set[str]] = field(default_factory=list)
-    expected_str: list[str] = field(default_factory=list)
+    expected_opts: Sequence[set[str]] = ()
+    expected_str: Sequence[str] = ()
     expected_exc: AbstractContextManager[Any] = nullcontext()
-    unexpected_opts: list[set[str]] = field(default_factory=list)
-    unexpected_str: list[str] = field(default_factory=list)
+    unexpected_opts: Sequence[set[str]] = ()
+    unexpected_str: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WrapperGroupTestCase:  # noqa: D101
     id: str  # noqa: A003
     input_opts: list[str]
@@ -51,7 +59,7 @@ class WrapperGroupTestCase:  # noqa: D101
     wrapper_groups: list[list[ProcessName]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileHelperTestCase:  # noqa: D101
     id: str  # noqa: A003
     input_tbc: Path
@@ -68,7 +76,7 @@ class FileHelperTestCase:  # noqa: D101
     tbc_types: TBCType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoBase:  # noqa: D101
     width: int
     height: int
@@ -80,43 +88,35 @@ class VideoBase:  # noqa: D101
     scan_order: str | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoBasePAL(VideoBase):  # noqa D101
-    width: int = field(default=928)
-    height: int = field(default=576)
-    pixel_aspect_ratio: str = field(default="0.833")
-    display_aspect_ratio: str = field(default="1.342")
-    framerate_num: str = field(default="25")
-    framerate_den: str = field(default="1")
-    scan_type: str = field(default="Interlaced")
-    scan_order: str | None = field(default="TFF")
-
-
-@dataclass
-class VideoBasePALM(VideoBase):  # noqa D101
-    width: int = field(default=760)
-    height: int = field(default=488)
-    pixel_aspect_ratio: str = field(default="0.852")
-    display_aspect_ratio: str = field(default="1.327")
-    framerate_num: str = field(default="30000")
-    framerate_den: str = field(default="1001")
-    scan_type: str = field(default="Interlaced")
-    scan_order: str | None = field(default="TFF")
-
-
-@dataclass
+    width: int = 928
+    height: int = 576
+    pixel_aspect_ratio: str = "0.833"
+    display_aspect_ratio: str = "1.342"
+    framerate_num: str = "25"
+    framerate_den: str = "1"
+    scan_type: str = "Interlaced"
+    scan_order: str | None = "TFF"
+
+
+@dataclass(slots=True, frozen=True)
 class VideoBaseNTSC(VideoBase):  # noqa D101
-    width: int = field(default=760)
-    height: int = field(default=488)
-    pixel_aspect_ratio: str = field(default="0.852")
-    display_aspect_ratio: str = field(default="1.327")
-    framerate_num: str = field(default="30000")
-    framerate_den: str = field(default="1001")
-    scan_type: str = field(default="Interlaced")
-    scan_order: str | None = field(default="TFF")
+    width: int = 760
+    height: int = 488
+    pixel_aspect_ratio: str = "0.852"
+    display_aspect_ratio: str = "1.327"
+    framerate_num: str = "30000"
+    framerate_den: str = "1001"
+    scan_type: str = "Interlaced"
+    scan_order: str | None = "TFF"
+
 
+# PAL-M shares the 525 line geometry and frame rate of NTSC
+VideoBasePALM = VideoBaseNTSC
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class VideoColor:  # noqa: D101
     color_space: str
     bit_depth: int | None
@@ -128,69 +128,61 @@ class VideoColor:  # noqa: D101
     matrix_coefficients_original: str | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoColorPAL(VideoColor):  # noqa: D101
-    color_space: str = field(default="YUV")
-    bit_depth: int | None = field(default=None)
-    chroma_subsampling: str | None = field(default=None)
-    color_range: str | None = field(default="Limited")
-    color_primaries: str = field(default="BT.601 PAL")
-    transfer_characteristics: str = field(default="BT.709")
-    matrix_coefficients: str = field(default="BT.470 System B/G")
-    matrix_coefficients_original: str | None = field(default=None)
-
-
-@dataclass
-class VideoColorPALM(VideoColor):  # noqa: D101
-    color_space: str = field(default="YUV")
-    bit_depth: int | None = field(default=None)
-    chroma_subsampling: str | None = field(default=None)
-    color_range: str | None = field(default="Limited")
-    color_primaries: str = field(default="BT.601 PAL")
-    transfer_characteristics: str = field(default="BT.709")
-    matrix_coefficients: str = field(default="BT.470 System B/G")
-    matrix_coefficients_original: str | None = field(default=None)
-
-
-@dataclass
+    color_space: str = "YUV"
+    bit_depth: int | None = None
+    chroma_subsampling: str | None = None
+    color_range: str | None = "Limited"
+    color_primaries: str = "BT.601 PAL"
+    transfer_characteristics: str = "BT.709"
+    matrix_coefficients: str = "BT.470 System B/G"
+    matrix_coefficients_original: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class VideoColorNTSC(VideoColor):  # noqa: D101
-    color_space: str = field(default="YUV")
-    bit_depth: int | None = field(default=None)
-    chroma_subsampling: str | None = field(default=None)
-    color_range: str | None = field(default="Limited")
-    color_primaries: str = field(default="BT.601 NTSC")
-    transfer_characteristics: str = field(default="BT.709")
-    matrix_coefficients: str = field(default="BT.601")
-    matrix_coefficients_original: str | None = field(default=None)
+    color_space: str = "YUV"
+    bit_depth: int | None = None
+    chroma_subsampling: str | None = None
+    color_range: str | None = "Limited"
+    color_primaries: str = "BT.601 NTSC"
+    transfer_characteristics: str = "BT.709"
+    matrix_coefficients: str = "BT.601"
+    matrix_coefficients_original: str | None = None
+
+
+# PAL-M uses PAL color encoding
+VideoColorPALM = VideoColorPAL
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioBase:  # noqa: D101
     format: str  # noqa: A003
     bit_depth: int
     sampling_rate: int
-    title: str | None = field(default=None)
-    language: str | None = field(default=None)
-    channel_s: int = field(default=2)
-    channel_layout: str = field(default="L R")
+    title: str | None = None
+    language: str | None = None
+    channel_s: int = 2
+    channel_layout: str = "L R"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OutputTestCase:  # noqa: D101
     id: str  # noqa: A003
     input_opts: list[str]
     input_tbc: str
     output_file: str
-    output_video_codec: dict[str, str | list[str]]
+    output_video_codec: dict[str, str | tuple[str, ...]]
     output_video_base: VideoBase
     output_video_color: VideoColor
-    output_audio_base: list[AudioBase] = field(default_factory=list)
+    output_audio_base: Sequence[AudioBase] = ()
     output_metadata: dict[str, Any] = field(default_factory=dict)
     expected_exc: AbstractContextManager[Any] = nullcontext()
 
 
 def get_path(path: str):  # noqa: D103
-    return Path.joinpath(Path(__file__).parent, "files", path).absolute()
+    return _FILES_DIR / path
 
 
 @pytest.fixture
@@ -209,24 +201,27 @@ def force_ansi_support_off(mocker: MockFixture) -> None:  # noqa: D103
     )
 
 
-@pytest.fixture
-def program_state():  # noqa D102
-    def _inner(test_opts: list[str], path: Path, out_file: str | None = "out_file"):
-        config = ProgramConfig()
+def create_program_state(  # noqa: D103
+    test_opts: list[str], path: Path, out_file: str | None = "out_file"
+) -> ProgramState:
+    config = ProgramConfig()
 
-        in_opts = [str(path)]
+    in_opts = [str(path)]
 
-        if out_file is not None:
-            in_opts += [out_file]
+    if out_file is not None:
+        in_opts += [out_file]
 
-        parser, opts = opts_parser.parse_opts(config, in_opts + test_opts)
-        files = FileHelper(opts, config)
-        state = ProgramState(opts, config, files)
-        opt_validators.validate_opts(state, parser, opts)
+    parser, opts = opts_parser.parse_opts(config, in_opts + test_opts)
+    files = FileHelper(opts, config)
+    state = ProgramState(opts, config, files)
+    opt_validators.validate_opts(state, parser, opts)
 
-        return state
+    return state
 
-    return _inner
+
+@pytest.fixture
+def program_state():  # noqa D102
+    return create_program_state
 
 
 @pytest.fixture
@@ -243,7 +238,7 @@ def ldtools_process_vbi_wrapper():  # noqa D102
 @pytest.fixture
 def ldtools_dropout_correct_wrapper():  # noqa D102
     def _init(state: ProgramState, tbc_type: TBCType):
-        pipe = PipeFactory.create_dummy_pipe()
+        pipe = _DUMMY_PIPE
 
         return WrapperLDDropoutCorrect(
             state,
@@ -256,7 +251,7 @@ def ldtools_dropout_correct_wrapper():  # noqa D102
 @pytest.fixture
 def ldtools_chroma_decoder_wrapper():  # noqa D102
     def _init(state: ProgramState, tbc_type: TBCType):
-        pipe = PipeFactory.create_dummy_pipe()
+        pipe = _DUMMY_PIPE
 
         return WrapperLDChromaDecoder(
             state,
@@ -271,7 +266,7 @@ def ffmpeg_wrapper_chroma():  # noqa D102
     def _inner(
         state: ProgramState, tbc_type: TBCType, export_mode: ExportMode | None = None
     ):
-        pipe = PipeFactory.create_dummy_pipe()
+        pipe = _DUMMY_PIPE
         input_pipes = (pipe,)
 
         if export_mode is None:
@@ -6,13 +6,105 @@ import pytest
 
 from tbc_video_export.common import exceptions
 from tbc_video_export.config import Config as ProgramConfig
-from tbc_video_export.config.config import Config
+from tbc_video_export.config.config import Config, GetProfileFilter
 from tbc_video_export.opts import opts_parser
 
 if TYPE_CHECKING:
     from pytest_mock import MockFixture
 
-    from tbc_video_export.config.json import JsonConfig
+    from tbc_video_export.config.json import JsonConfig, JsonSubProfileVideo
+
+
+_VIDEO_PROFILE_TEST: JsonSubProfileVideo = {
+    "name": "video_profile_test",
+    "description": "Video Profile Test",
+    "codec": "ffv1",
+    "video_format": "yuv444p16le",
+    "container": "mkv",
+}
+
+_PROFILE_NAMES_CONFIG: JsonConfig = {
+    "profiles": [
+        {
+            "name": "test1",
+            "video_profile": "video_profile_test",
+        },
+        {
+            "name": "test2",
+            "video_profile": "video_profile_test",
+        },
+    ],
+    "video_profiles": [_VIDEO_PROFILE_TEST],
+    "audio_profiles": [],
+    "filter_profiles": [],
+}
+
+_DEFAULT_PROFILE_CONFIG: JsonConfig = {
+    "profiles": [
+        {
+            "name": "test1",
+            "video_profile": "video_profile_test",
+        },
+        {
+            "name": "test2",
+            "default": True,
+            "video_profile": "video_profile_test",
+        },
+    ],
+    "video_profiles": [_VIDEO_PROFILE_TEST],
+    "audio_profiles": [],
+    "filter_profiles": [],
+}
+
+_SINGLE_VIDEO_PROFILE_CONFIG: JsonConfig = {
+    "profiles": [
+        {
+            "name": "test1",
+            "video_profile": "video_profile_test",
+        },
+    ],
+    "video_profiles": [_VIDEO_PROFILE_TEST],
+    "audio_profiles": [],
+    "filter_profiles": [],
+}
+
+_MULTIPLE_VIDEO_PROFILE_CONFIG: JsonConfig = {
+    "profiles": [
+        {
+            "name": "test1",
+            "video_profile": [
+                "video_profile_test1",
+                "video_profile_test2",
+                "video_profile_test3",
+            ],
+        },
+    ],
+    "video_profiles": [
+        {
+            "name": "video_profile_test1",
+            "description": "Video Profile Test 1",
+            "codec": "ffv1",
+            "video_format": "yuv444p16le",
+            "container": "mkv",
+        },
+        {
+            "name": "video_profile_test2",
+            "description": "Video Profile Test 2",
+            "codec": "ffv1",
+            "video_format": "yuv444p16le",
+            "container": "mkv",
+        },
+        {
+            "name": "video_profile_test3",
+            "description": "Video Profile Test 3",
+            "codec": "ffv1",
+            "video_format": "yuv444p16le",
+            "container": "mkv",
+        },
+    ],
+    "audio_profiles": [],
+    "filter_profiles": [],
+}
 
 
 class TestProfile:
@@ -57,86 +149,19 @@ class TestProfile:
             _ = config.filter_profiles
 
     def test_profile_names(self, mocker: MockFixture) -> None:  # noqa: D102
-        json_config: JsonConfig = {
-            "profiles": [
-                {
-                    "name": "test1",
-                    "video_profile": "video_profile_test",
-                },
-                {
-                    "name": "test2",
-                    "video_profile": "video_profile_test",
-                },
-            ],
-            "video_profiles": [
-                {
-                    "name": "video_profile_test",
-                    "description": "Video Profile Test",
-                    "codec": "ffv1",
-                    "video_format": "yuv444p16le",
-                    "container": "mkv",
-                }
-            ],
-            "audio_profiles": [],
-            "filter_profiles": [],
-        }
-
-        mocker.patch(f"{self.module}.config.DEFAULT_CONFIG", json_config)
+        mocker.patch(f"{self.module}.config.DEFAULT_CONFIG", _PROFILE_NAMES_CONFIG)
         config = Config()
         assert config.get_profile_names() == ["test1", "test2"]
 
     def test_default_profile(self, mocker: MockFixture) -> None:  # noqa: D102
-        json_config: JsonConfig = {
-            "profiles": [
-                {
-                    "name": "test1",
-                    "video_profile": "video_profile_test",
-                },
-                {
-                    "name": "test2",
-                    "default": True,
-                    "video_profile": "video_profile_test",
-                },
-            ],
-            "video_profiles": [
-                {
-                    "name": "video_profile_test",
-                    "description": "Video Profile Test",
-                    "codec": "ffv1",
-                    "video_format": "yuv444p16le",
-                    "container": "mkv",
-                }
-            ],
-            "audio_profiles": [],
-            "filter_profiles": [],
-        }
-
-        mocker.patch(f"{self.module}.config.DEFAULT_CONFIG", json_config)
+        mocker.patch(f"{self.module}.config.DEFAULT_CONFIG", _DEFAULT_PROFILE_CONFIG)
         config = Config()
         assert config.get_default_profile().name == "test2"
 
     def test_single_video_profile(self, mocker: MockFixture) -> None:  # noqa: D102
-        json_config: JsonConfig = {
-            "profiles": [
-                {
-                    "name": "test1",
-                    "video_profile": "video_profile_test",
-                },
-            ],
-            "video_profiles": [
-                {
-                    "name": "video_profile_test",
-                    "description": "Video Profile Test",
-                    "codec": "ffv1",
-                    "video_format": "yuv444p16le",
-                    "container": "mkv",
-                }
-            ],
-            "audio_profiles": [],
-            "filter_profiles": [],
-        }
-
-        mocker.patch(f"{self.module}.config.DEFAULT_CONFIG", json_config)
+        mocker.patch(
+            f"{self.module}.config.DEFAULT_CONFIG", _SINGLE_VIDEO_PROFILE_CONFIG
+        )
         config = Config()
 
         video_profiles = config.get_video_profiles_for_profile("test1")
@@ -145,45 +170,9 @@ class TestProfile:
         assert video_profile.name == "video_profile_test"
 
     def test_multiple_video_profile(self, mocker: MockFixture) -> None:  # noqa: D102
-        json_config: JsonConfig = {
-            "profiles": [
-                {
-                    "name": "test1",
-                    "video_profile": [
-                        "video_profile_test1",
-                        "video_profile_test2",
-                        "video_profile_test3",
-                    ],
-                },
-            ],
-            "video_profiles": [
-                {
-                    "name": "video_profile_test1",
-                    "description": "Video Profile Test 1",
-                    "codec": "ffv1",
-                    "video_format": "yuv444p16le",
-                    "container": "mkv",
-                },
-                {
-                    "name": "video_profile_test2",
-                    "description": "Video Profile Test 2",
-                    "codec": "ffv1",
-                    "video_format": "yuv444p16le",
-                    "container": "mkv",
-                },
-                {
-                    "name": "video_profile_test3",
-                    "description": "Video Profile Test 3",
-                    "codec": "ffv1",
-                    "video_format": "yuv444p16le",
-                    "container": "mkv",
-                },
-            ],
-            "audio_profiles": [],
-            "filter_profiles": [],
-        }
-
-        mocker.patch(f"{self.module}.config.DEFAULT_CONFIG", json_config)
+        mocker.patch(
+            f"{self.module}.config.DEFAULT_CONFIG", _MULTIPLE_VIDEO_PROFILE_CONFIG
+        )
         config = Config()
 
         video_profiles = config.get_video_profiles_for_profile("test1")
@@ -191,6 +180,35 @@ class TestProfile:
         video_profile = video_profiles[2]
         assert video_profile.name == "video_profile_test3"
 
+    def test_get_profile_cached(self) -> None:  # noqa: D102
+        config = Config()
+        name = config.get_default_profile().name
+
+        profile = config.get_profile(GetProfileFilter(name))
+        assert profile.name == name
+        assert config.get_profile(GetProfileFilter(name)) is profile
+
+        with pytest.raises(exceptions.InvalidProfileError):
+            config.get_profile(GetProfileFilter("invalid_profile"))
+
+    def test_profile_opts_not_shared(self) -> None:  # noqa: D102
+        config = Config()
+        profile = config.get_default_profile()
+
+        video_opts = profile.video_profile.opts
+        assert video_opts is not None
+
+        expected = list(video_opts)
+        video_opts.append("-test")
+
+        assert list(profile.video_profile.opts or ()) == expected
+
+        if (audio_profile := profile.audio_profile) is not None:
+            expected = list(audio_profile.opts)
+            audio_profile.opts.append("-test")
+
+            assert list(audio_profile.opts) == expected
+
     def test_config_file_opt(self) -> None:  # noqa: D102
         pre_opts, _ = opts_parser.parse_pre_opts(
             [
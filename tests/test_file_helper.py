@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING
 
 import pytest
@@ -10,69 +11,90 @@ from tbc_video_export.common import exceptions
 from tbc_video_export.common.enums import ProcessName, TBCType, VideoSystem
 from tbc_video_export.common.file_helper import FileHelper
 
-from .conftest import FileHelperTestCase
+from .conftest import FileHelperTestCase, create_program_state
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pytest_mock import MockFixture
+
     from tbc_video_export.program_state import ProgramState
 
 
+_TEST_CASES = (
+    FileHelperTestCase(
+        id="pal svideo",
+        input_tbc=Path("tests/files/pal_svideo.tbc"),
+        input_name=Path("tests/files/pal_svideo"),
+        luma_tbc=Path("tests/files/pal_svideo.tbc"),
+        output_name=Path("out_file"),
+        output_container="mkv",
+        output_video_file=Path("out_file.mkv"),
+        output_video_file_luma=Path("out_file.luma.mkv"),
+        is_ld=False,
+        efm_file=None,
+        ffmetadata_file=Path("out_file.ffmetadata"),
+        cc_file=Path("out_file.scc"),
+        tbc_types=TBCType.LUMA | TBCType.CHROMA,
+    ),
+    FileHelperTestCase(
+        id="pal composite",
+        input_tbc=Path("tests/files/pal_composite.tbc"),
+        input_name=Path("tests/files/pal_composite"),
+        luma_tbc=Path("tests/files/pal_composite.tbc"),
+        output_name=Path("out_file"),
+        output_container="mkv",
+        output_video_file=Path("out_file.mkv"),
+        output_video_file_luma=Path("out_file.luma.mkv"),
+        is_ld=False,
+        efm_file=None,
+        ffmetadata_file=Path("out_file.ffmetadata"),
+        cc_file=Path("out_file.scc"),
+        tbc_types=TBCType.COMBINED,
+    ),
+    FileHelperTestCase(
+        id="pal composite (ld)",
+        input_tbc=Path("tests/files/pal_composite_ld.tbc"),
+        input_name=Path("tests/files/pal_composite_ld"),
+        luma_tbc=Path("tests/files/pal_composite_ld.tbc"),
+        output_name=Path("out_file"),
+        output_container="mkv",
+        output_video_file=Path("out_file.mkv"),
+        output_video_file_luma=Path("out_file.luma.mkv"),
+        is_ld=True,
+        efm_file=Path("tests/files/pal_composite_ld.efm"),
+        ffmetadata_file=Path("out_file.ffmetadata"),
+        cc_file=Path("out_file.scc"),
+        tbc_types=TBCType.COMBINED,
+    ),
+)
+
+_PARAMS = [pytest.param(test_case, id=test_case.id) for test_case in _TEST_CASES]
+
+
+@pytest.fixture(scope="module")
+def helper() -> FileHelper:  # noqa: D103
+    state = create_program_state([], Path("tests/files/pal_svideo.tbc"))
+    return FileHelper(state.opts, state.config)
+
+
+@pytest.fixture(scope="module")
+def helper_all_tools() -> FileHelper:  # noqa: D103
+    state = create_program_state(
+        [
+            "--process-efm",
+            "--process-vbi",
+            "--export-metadata",
+        ],
+        Path("tests/files/pal_svideo.tbc"),
+    )
+    return FileHelper(state.opts, state.config)
+
+
 class TestTBCJson:
     """Tests for tbc json helper."""
 
-    test_cases = [
-        FileHelperTestCase(
-            id="pal svideo",
-            input_tbc=Path("tests/files/pal_svideo.tbc"),
-            input_name=Path("tests/files/pal_svideo"),
-            luma_tbc=Path("tests/files/pal_svideo.tbc"),
-            output_name=Path("out_file"),
-            output_container="mkv",
-            output_video_file=Path("out_file.mkv"),
-            output_video_file_luma=Path("out_file.luma.mkv"),
-            is_ld=False,
-            efm_file=None,
-            ffmetadata_file=Path("out_file.ffmetadata"),
-            cc_file=Path("out_file.scc"),
-            tbc_types=TBCType.LUMA | TBCType.CHROMA,
-        ),
-        FileHelperTestCase(
-            id="pal composite",
-            input_tbc=Path("tests/files/pal_composite.tbc"),
-            input_name=Path("tests/files/pal_composite"),
-            luma_tbc=Path("tests/files/pal_composite.tbc"),
-            output_name=Path("out_file"),
-            output_container="mkv",
-            output_video_file=Path("out_file.mkv"),
-            output_video_file_luma=Path("out_file.luma.mkv"),
-            is_ld=False,
-            efm_file=None,
-            ffmetadata_file=Path("out_file.ffmetadata"),
-            cc_file=Path("out_file.scc"),
-            tbc_types=TBCType.COMBINED,
-        ),
-        FileHelperTestCase(
-            id="pal composite (ld)",
-            input_tbc=Path("tests/files/pal_composite_ld.tbc"),
-            input_name=Path("tests/files/pal_composite_ld"),
-            luma_tbc=Path("tests/files/pal_composite_ld.tbc"),
-            output_name=Path("out_file"),
-            output_container="mkv",
-            output_video_file=Path("out_file.mkv"),
-            output_video_file_luma=Path("out_file.luma.mkv"),
-            is_ld=True,
-            efm_file=Path("tests/files/pal_composite_ld.efm"),
-            ffmetadata_file=Path("out_file.ffmetadata"),
-            cc_file=Path("out_file.scc"),
-            tbc_types=TBCType.COMBINED,
-        ),
-    ]
-
-    @pytest.mark.parametrize(
-        "test_case",
-        (pytest.param(test_case, id=test_case.id) for test_case in test_cases),
-    )
+    @pytest.mark.parametrize("test_case", _PARAMS)
     def test_paths(  # noqa: D102
         self,
         program_state: Callable[[list[str], Path], ProgramState],
@@ -110,6 +132,7 @@ class TestTBCJson:
     def test_missing_tbc(  # noqa: D102
         self,
         program_state: Callable[[list[str], Path], ProgramState],
+        tmp_path: Path,
     ) -> None:
         state = program_state([], Path("tests/files/pal_svideo.tbc"))
         helper = FileHelper(state.opts, state.config)
@@ -121,11 +144,10 @@ class TestTBCJson:
 
             assert e.value == "Unable to find luma TBC."
 
-        with (
-            NamedTemporaryFile(suffix="_chroma.tbc") as file,
-            pytest.raises(exceptions.TBCError) as e,
-        ):
-            state = program_state([], Path(file.name.replace("_chroma.tbc", "")))
+        (tmp_path / "missing_chroma.tbc").touch()
+
+        with pytest.raises(exceptions.TBCError) as e:
+            state = program_state([], tmp_path / "missing")
             helper = FileHelper(state.opts, state.config)
 
             assert e.value == "TBC not found at location."
@@ -136,6 +158,36 @@ class TestTBCJson:
 
             assert e.value == "Location contains chroma TBC but no luma TBC."
 
+    def test_input_name_case(  # noqa: D102
+        self,
+        program_state: Callable[[list[str], Path], ProgramState],
+        tmp_path: Path,
+        mocker: MockFixture,
+    ) -> None:
+        # the tbc on disk differs in case from the given input name
+        shutil.copy("tests/files/pal_composite.tbc", tmp_path / "tape1.tbc")
+        shutil.copy("tests/files/pal_composite.tbc.json", tmp_path / "Tape1.tbc.json")
+
+        # emulate a case-insensitive filesystem (e.g. Windows, macOS)
+        is_file = Path.is_file
+        mocker.patch.object(
+            Path,
+            "is_file",
+            autospec=True,
+            side_effect=lambda path: (
+                path.parent.is_dir()
+                and any(
+                    name.lower() == path.name.lower() and is_file(path.with_name(name))
+                    for name in os.listdir(path.parent)
+                )
+            ),
+        )
+
+        state = program_state([], tmp_path / "Tape1")
+        helper = FileHelper(state.opts, state.config)
+
+        assert helper.tbcs == {TBCType.COMBINED: tmp_path / "Tape1.tbc"}
+
     procs = [
         ProcessName.FFMPEG,
         ProcessName.LD_CHROMA_DECODER,
@@ -155,13 +207,10 @@ class TestTBCJson:
     @pytest.mark.parametrize("tbc_type", tbc_types)
     def test_log_files(  # noqa: D102
         self,
-        program_state: Callable[[list[str], Path], ProgramState],
+        helper: FileHelper,
         proc: ProcessName,
         tbc_type: TBCType,
     ) -> None:
-        state = program_state([], Path("tests/files/pal_svideo.tbc"))
-        helper = FileHelper(state.opts, state.config)
-
         timestamp = "__timestamp__"
 
         assert helper.get_log_file(proc, tbc_type, timestamp) == Path(
@@ -170,45 +219,38 @@ class TestTBCJson:
 
     @pytest.mark.parametrize("proc", procs)
     def test_tools(  # noqa: D102
+        self,
+        helper_all_tools: FileHelper,
+        proc: ProcessName,
+    ) -> None:
+        assert helper_all_tools.get_tool(proc) == Path(str(proc))
+
+    @pytest.mark.parametrize("proc", procs)
+    def test_tools_appimage(  # noqa: D102
         self,
         program_state: Callable[[list[str], Path], ProgramState],
         proc: ProcessName,
+        tmp_path: Path,
     ) -> None:
+        appimage = tmp_path / "appimage"
+        appimage.touch()
+
         state = program_state(
             [
                 "--process-efm",
                 "--process-vbi",
                 "--export-metadata",
+                "--appimage",
+                str(appimage),
             ],
             Path("tests/files/pal_svideo.tbc"),
         )
         helper = FileHelper(state.opts, state.config)
 
-        assert helper.get_tool(proc) == Path(str(proc))
-
-    @pytest.mark.parametrize("proc", procs)
-    def test_tools_appimage(  # noqa: D102
-        self,
-        program_state: Callable[[list[str], Path], ProgramState],
-        proc: ProcessName,
-    ) -> None:
-        with NamedTemporaryFile() as file:
-            state = program_state(
-                [
-                    "--process-efm",
-                    "--process-vbi",
-                    "--export-metadata",
-                    "--appimage",
-                    file.name,
-                ],
-                Path("tests/files/pal_svideo.tbc"),
-            )
-            helper = FileHelper(state.opts, state.config)
-
-            assert helper.get_tool(proc) == [
-                Path(file.name),
-                str(proc),
-            ]
+        assert helper.get_tool(proc) == [
+            appimage,
+            str(proc),
+        ]
 
     def test_out_file_dir(  # noqa: D102
         self,
@@ -233,42 +275,43 @@ class TestTBCJson:
     def test_out_file(  # noqa: D102
         self,
         program_state: Callable[[list[str], Path, str], ProgramState],
+        tmp_path: Path,
     ) -> None:
-        with NamedTemporaryFile(suffix=".mkv") as file:
-            state = program_state(
-                [
-                    "--process-efm",
-                    "--process-vbi",
-                    "--export-metadata",
-                ],
-                Path("tests/files/pal_svideo.tbc"),
-                file.name,
-            )
-            helper = FileHelper(state.opts, state.config)
+        file = tmp_path / "out.mkv"
+        file.touch()
+
+        state = program_state(
+            [
+                "--process-efm",
+                "--process-vbi",
+                "--export-metadata",
+            ],
+            Path("tests/files/pal_svideo.tbc"),
+            str(file),
+        )
+        helper = FileHelper(state.opts, state.config)
 
-            with pytest.raises(exceptions.FileIOError) as e:
-                helper.check_output_file()
+        with pytest.raises(exceptions.FileIOError) as e:
+            helper.check_output_file()
 
-                assert (
-                    e.value == f"{file.name} exists, use --overwrite or move the file."
-                )
+            assert e.value == f"{file} exists, use --overwrite or move the file."
 
-        with NamedTemporaryFile(suffix=".luma.mkv") as file:
-            state = program_state(
-                [
-                    "--process-efm",
-                    "--process-vbi",
-                    "--export-metadata",
-                    "--two-step",
-                ],
-                Path("tests/files/pal_svideo.tbc"),
-                file.name,
-            )
-            helper = FileHelper(state.opts, state.config)
+        file = tmp_path / "out_two_step.luma.mkv"
+        file.touch()
+
+        state = program_state(
+            [
+                "--process-efm",
+                "--process-vbi",
+                "--export-metadata",
+                "--two-step",
+            ],
+            Path("tests/files/pal_svideo.tbc"),
+            str(file),
+        )
+        helper = FileHelper(state.opts, state.config)
 
-            with pytest.raises(exceptions.FileIOError) as e:
-                helper.check_output_file()
+        with pytest.raises(exceptions.FileIOError) as e:
+            helper.check_output_file()
 
-                assert (
-                    e.value == f"{file.name} exists, use --overwrite or move the file."
-                )
+            assert e.value == f"{file} exists, use --overwrite or move the file."
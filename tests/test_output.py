@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from contextlib import suppress
 from dataclasses import fields
-from pathlib import Path
-from typing import Any
+from functools import cache, partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from pymediainfo import MediaInfo  # pyright: ignore[reportMissingTypeStubs]
 
 from tbc_video_export import main
 from tests.conftest import (
@@ -20,6 +20,43 @@ from tests.conftest import (
     VideoColorPALM,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from pymediainfo import MediaInfo  # pyright: ignore[reportMissingTypeStubs]
+
+
+# frozen, so cases without overrides can share one instance
+_VIDEO_BASE_PAL = VideoBasePAL()
+_VIDEO_BASE_PALM = VideoBasePALM()
+_VIDEO_BASE_NTSC = VideoBaseNTSC()
+
+
+@cache
+def _field_getters(cls: type[Any]) -> tuple[tuple[str, attrgetter[Any]], ...]:
+    """Return field names and getters for a dataclass type."""
+    return tuple((field.name, attrgetter(field.name)) for field in fields(cls))
+
+
+def _check_track_fields(expected: Any, track: Any) -> None:
+    """Check that a track matches every non-None field of a dataclass."""
+    for name, get in _field_getters(type(expected)):
+        if (value := get(expected)) is not None:
+            target_field = getattr(track, name, None)
+            assert target_field is not None
+            assert target_field == value
+
+
+def _build_cases(
+    input_tbc: str, variants: Sequence[Callable[..., OutputTestCase]]
+) -> list[OutputTestCase]:
+    """Return test cases for a TBC from variants shared by its video system."""
+    return [
+        variant(input_tbc=input_tbc, output_file=f"{input_tbc}.mkv")
+        for variant in variants
+    ]
+
 
 class TestOutput:
     """Tests for output video files.
@@ -62,98 +99,87 @@ class TestOutput:
         "x264": {
             "format": "AVC",
             "format_profile": "High@L3.1",
-            "encoding_settings": [
+            "encoding_settings": (
                 "crf=18.0",
                 "interlaced=tff",
-            ],
+            ),
         },
         "x264_lossless": {
             "format": "AVC",
             "format_profile": "High 4:4:4 Predictive@L6.2",
-            "encoding_settings": [
+            "encoding_settings": (
                 "qp=0",
                 "interlaced=tff",
-            ],
+            ),
         },
         "x264_web": {
             "format": "AVC",
             "format_profile": "High@L3.1",
-            "encoding_settings": [
-                "crf=18.0",
-            ],
+            "encoding_settings": ("crf=18.0",),
         },
         "x265": {
             "format": "HEVC",
             "format_profile": "Main@L3@Main",
-            "encoding_settings": [
+            "encoding_settings": (
                 "crf=23.0",
                 "interlace=1",
-            ],
+            ),
         },
         "x265_lossless": {
             "format": "HEVC",
             "format_profile": "Format Range@L8.5@Main",
-            "encoding_settings": ["interlace=1", " lossless "],
+            "encoding_settings": ("interlace=1", " lossless "),
         },
         "x265_web": {
             "format": "HEVC",
             "format_profile": "Main@L3.1@Main",
-            "encoding_settings": [
+            "encoding_settings": (
                 "crf=23.0",
                 "interlace=0",
-            ],
+            ),
         },
         "av1": {
             "format": "AV1",
             "format_profile": "Main@L3.0",
-            "encoding_settings": [],
+            "encoding_settings": (),
         },
         "av1_web": {
             "format": "AV1",
             "format_profile": "Main@L3.1",
-            "encoding_settings": [],
+            "encoding_settings": (),
         },
     }
 
-    codec_ffv1: dict[str, Any] = {
-        "format": "FFV1",
-        "format_settings__gop": "N=1",
-        "coder_type": "Range Coder",
-        "maxslicescount": "24",
-        "errordetectiontype": "Per slice",
-    }
+    codec_ffv1 = codec_values["ffv1"]
 
-    pal_svideo_test_cases = [
-        OutputTestCase(
+    pal_variants = (
+        partial(
+            OutputTestCase,
             id="default",
             input_opts=["--quiet", "--overwrite"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="luma",
             input_opts=["--quiet", "--overwrite", "--luma-only"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 color_space="Y",
                 bit_depth=16,
                 chroma_subsampling=None,
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="4fsc",
             input_opts=["--quiet", "--overwrite", "--luma-4fsc"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBasePAL(
                 width=1135,
@@ -167,16 +193,14 @@ class TestOutput:
                 chroma_subsampling=None,
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="vbi",
             input_opts=["--quiet", "--overwrite", "--vbi"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBasePAL(
                 width=928,
                 height=608,
-                pixel_aspect_ratio="0.833",
                 display_aspect_ratio="1.271",
             ),
             output_video_color=VideoColorPAL(
@@ -184,11 +208,10 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="letterbox",
             input_opts=["--quiet", "--overwrite", "--letterbox"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBasePAL(
                 width=928,
@@ -201,124 +224,10 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
-            id="anamorphic",
-            input_opts=["--quiet", "--overwrite", "--force-anamorphic"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=576,
-                pixel_aspect_ratio="1.110",
-                display_aspect_ratio="1.789",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="full vertical",
-            input_opts=["--quiet", "--overwrite", "--full-vertical"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=624,
-                pixel_aspect_ratio="0.833",
-                display_aspect_ratio="1.239",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-    ]
-
-    pal_composite_test_cases = [
-        OutputTestCase(
-            id="default",
-            input_opts=["--quiet", "--overwrite"],
-            input_tbc="pal_composite",
-            output_file="pal_composite.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="luma",
-            input_opts=["--quiet", "--overwrite", "--luma-only"],
-            input_tbc="pal_svideo",
-            output_file="pal_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
-            output_video_color=VideoColorPAL(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="4fsc",
-            input_opts=["--quiet", "--overwrite", "--luma-4fsc"],
-            input_tbc="pal_composite",
-            output_file="pal_composite.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=1135,
-                height=626,
-                pixel_aspect_ratio="1.000",
-                display_aspect_ratio="1.813",
-            ),
-            output_video_color=VideoColorPAL(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="vbi",
-            input_opts=["--quiet", "--overwrite", "--vbi"],
-            input_tbc="pal_composite",
-            output_file="pal_composite.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=608,
-                display_aspect_ratio="1.271",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="letterbox",
-            input_opts=["--quiet", "--overwrite", "--letterbox"],
-            input_tbc="pal_composite",
-            output_file="pal_composite.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=432,
-                pixel_aspect_ratio="0.828",
-                display_aspect_ratio="1.778",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="widescreen",
             input_opts=["--quiet", "--overwrite", "--force-anamorphic"],
-            input_tbc="pal_composite",
-            output_file="pal_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBasePAL(
                 width=928,
@@ -331,11 +240,10 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="full vertical",
             input_opts=["--quiet", "--overwrite", "--full-vertical"],
-            input_tbc="pal_composite",
-            output_file="pal_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBasePAL(
                 width=928,
@@ -347,263 +255,36 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-    ]
-
-    pal_composite_ld_test_cases = [
-        OutputTestCase(
-            id="default",
-            input_opts=["--quiet", "--overwrite"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="luma",
-            input_opts=["--quiet", "--overwrite", "--luma-only"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
-            output_video_color=VideoColorPAL(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="4fsc",
-            input_opts=["--quiet", "--overwrite", "--luma-4fsc"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=1135,
-                height=626,
-                pixel_aspect_ratio="1.000",
-                display_aspect_ratio="1.813",
-            ),
-            output_video_color=VideoColorPAL(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="vbi",
-            input_opts=["--quiet", "--overwrite", "--vbi"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=608,
-                display_aspect_ratio="1.271",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="letterbox",
-            input_opts=["--quiet", "--overwrite", "--letterbox"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=432,
-                pixel_aspect_ratio="0.828",
-                display_aspect_ratio="1.778",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="widescreen",
-            input_opts=["--quiet", "--overwrite", "--force-anamorphic"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=576,
-                pixel_aspect_ratio="1.110",
-                display_aspect_ratio="1.789",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="full vertical",
-            input_opts=["--quiet", "--overwrite", "--full-vertical"],
-            input_tbc="pal_composite_ld",
-            output_file="pal_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(
-                width=928,
-                height=624,
-                display_aspect_ratio="1.239",
-            ),
-            output_video_color=VideoColorPAL(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-    ]
-
-    ntsc_svideo_test_cases = [
-        OutputTestCase(
-            id="default",
-            input_opts=["--quiet", "--overwrite"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="luma",
-            input_opts=["--quiet", "--overwrite", "--luma-only"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(),
-            output_video_color=VideoColorNTSC(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="4fsc",
-            input_opts=["--quiet", "--overwrite", "--luma-4fsc"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=910,
-                height=526,
-                pixel_aspect_ratio="1.000",
-                display_aspect_ratio="1.730",
-            ),
-            output_video_color=VideoColorNTSC(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="vbi",
-            input_opts=["--quiet", "--overwrite", "--vbi"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=509,
-                display_aspect_ratio="1.273",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="letterbox",
-            input_opts=["--quiet", "--overwrite", "--letterbox"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=326,
-                pixel_aspect_ratio="0.763",
-                display_aspect_ratio="1.778",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="widescreen",
-            input_opts=["--quiet", "--overwrite", "--force-anamorphic"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=488,
-                pixel_aspect_ratio="1.136",
-                display_aspect_ratio="1.770",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="full vertical",
-            input_opts=["--quiet", "--overwrite", "--full-vertical"],
-            input_tbc="ntsc_svideo",
-            output_file="ntsc_svideo.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=528,
-                display_aspect_ratio="1.227",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-    ]
+    )
 
-    ntsc_composite_test_cases = [
-        OutputTestCase(
+    ntsc_variants = (
+        partial(
+            OutputTestCase,
             id="default",
             input_opts=["--quiet", "--overwrite"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(),
+            output_video_base=_VIDEO_BASE_NTSC,
             output_video_color=VideoColorNTSC(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="luma",
             input_opts=["--quiet", "--overwrite", "--luma-only"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(),
+            output_video_base=_VIDEO_BASE_NTSC,
             output_video_color=VideoColorNTSC(
                 color_space="Y",
                 bit_depth=16,
                 chroma_subsampling=None,
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="4fsc",
             input_opts=["--quiet", "--overwrite", "--luma-4fsc"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBaseNTSC(
                 width=910,
@@ -617,11 +298,10 @@ class TestOutput:
                 chroma_subsampling=None,
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="vbi",
             input_opts=["--quiet", "--overwrite", "--vbi"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBaseNTSC(
                 width=760,
@@ -633,11 +313,10 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="letterbox",
             input_opts=["--quiet", "--overwrite", "--letterbox"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBaseNTSC(
                 width=760,
@@ -650,11 +329,10 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="widescreen",
             input_opts=["--quiet", "--overwrite", "--force-anamorphic"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBaseNTSC(
                 width=760,
@@ -667,11 +345,10 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-        OutputTestCase(
+        partial(
+            OutputTestCase,
             id="full vertical",
             input_opts=["--quiet", "--overwrite", "--full-vertical"],
-            input_tbc="ntsc_composite",
-            output_file="ntsc_composite.mkv",
             output_video_codec=codec_ffv1,
             output_video_base=VideoBaseNTSC(
                 width=760,
@@ -683,119 +360,14 @@ class TestOutput:
                 chroma_subsampling="4:2:2",
             ),
         ),
-    ]
+    )
 
-    ntsc_composite_ld_test_cases = [
-        OutputTestCase(
-            id="default",
-            input_opts=["--quiet", "--overwrite"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="luma",
-            input_opts=["--quiet", "--overwrite", "--luma-only"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(),
-            output_video_color=VideoColorNTSC(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="4fsc",
-            input_opts=["--quiet", "--overwrite", "--luma-4fsc"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=910,
-                height=526,
-                pixel_aspect_ratio="1.000",
-                display_aspect_ratio="1.730",
-            ),
-            output_video_color=VideoColorNTSC(
-                color_space="Y",
-                bit_depth=16,
-                chroma_subsampling=None,
-            ),
-        ),
-        OutputTestCase(
-            id="vbi",
-            input_opts=["--quiet", "--overwrite", "--vbi"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=509,
-                display_aspect_ratio="1.273",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="letterbox",
-            input_opts=["--quiet", "--overwrite", "--letterbox"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=326,
-                pixel_aspect_ratio="0.763",
-                display_aspect_ratio="1.778",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="widescreen",
-            input_opts=["--quiet", "--overwrite", "--force-anamorphic"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=488,
-                pixel_aspect_ratio="1.136",
-                display_aspect_ratio="1.770",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-        OutputTestCase(
-            id="full vertical",
-            input_opts=["--quiet", "--overwrite", "--full-vertical"],
-            input_tbc="ntsc_composite_ld",
-            output_file="ntsc_composite_ld.mkv",
-            output_video_codec=codec_ffv1,
-            output_video_base=VideoBaseNTSC(
-                width=760,
-                height=528,
-                display_aspect_ratio="1.227",
-            ),
-            output_video_color=VideoColorNTSC(
-                bit_depth=10,
-                chroma_subsampling="4:2:2",
-            ),
-        ),
-    ]
+    pal_svideo_test_cases = _build_cases("pal_svideo", pal_variants)
+    pal_composite_test_cases = _build_cases("pal_composite", pal_variants)
+    pal_composite_ld_test_cases = _build_cases("pal_composite_ld", pal_variants)
+    ntsc_svideo_test_cases = _build_cases("ntsc_svideo", ntsc_variants)
+    ntsc_composite_test_cases = _build_cases("ntsc_composite", ntsc_variants)
+    ntsc_composite_ld_test_cases = _build_cases("ntsc_composite_ld", ntsc_variants)
 
     palm_svideo_test_cases = [
         OutputTestCase(
@@ -804,7 +376,7 @@ class TestOutput:
             input_tbc="palm_svideo",
             output_file="palm_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePALM(),
+            output_video_base=_VIDEO_BASE_PALM,
             output_video_color=VideoColorPALM(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -816,7 +388,7 @@ class TestOutput:
             input_tbc="palm_svideo",
             output_file="palm_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePALM(),
+            output_video_base=_VIDEO_BASE_PALM,
             output_video_color=VideoColorPALM(
                 color_space="Y",
                 bit_depth=16,
@@ -864,7 +436,7 @@ class TestOutput:
             input_tbc="palm_svideo",
             output_file="palm_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePALM(),
+            output_video_base=_VIDEO_BASE_PALM,
             output_video_color=VideoColorPALM(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -914,7 +486,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=8,
                 chroma_subsampling="4:2:0",
@@ -926,7 +498,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:0",
@@ -938,7 +510,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=16,
                 chroma_subsampling="4:2:0",
@@ -950,7 +522,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=8,
                 chroma_subsampling="4:2:2",
@@ -962,19 +534,19 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
             ),
         ),
         OutputTestCase(
-            id="yuv420p16le",
+            id="yuv422p16le",
             input_opts=["--quiet", "--overwrite", "--yuv422", "--16bit"],
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=16,
                 chroma_subsampling="4:2:2",
@@ -986,7 +558,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=8,
                 chroma_subsampling="4:4:4",
@@ -998,7 +570,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:4:4",
@@ -1010,7 +582,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=16,
                 chroma_subsampling="4:4:4",
@@ -1022,7 +594,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 color_space="Y",
                 bit_depth=8,
@@ -1035,7 +607,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 color_space="Y",
                 bit_depth=16,
@@ -1048,7 +620,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 color_space="Y",
                 bit_depth=16,
@@ -1064,7 +636,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mov",
             output_video_codec=codec_values["prores_hq"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 chroma_subsampling="4:2:2",
                 color_range=None,
@@ -1076,7 +648,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mov",
             output_video_codec=codec_values["prores_4444xq"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 chroma_subsampling="4:4:4",
                 color_range=None,
@@ -1088,7 +660,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mov",
             output_video_codec=codec_values["v210"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1101,7 +673,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mov",
             output_video_codec=codec_values["v410"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=None,
                 chroma_subsampling=None,
@@ -1176,7 +748,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mov",
             output_video_codec=codec_values["x265"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=8,
                 chroma_subsampling="4:2:0",
@@ -1188,7 +760,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mov",
             output_video_codec=codec_values["x265_lossless"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1216,7 +788,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mp4",
             output_video_codec=codec_values["av1"],
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=8,
                 chroma_subsampling="4:2:0",
@@ -1252,7 +824,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1278,7 +850,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1311,7 +883,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1349,7 +921,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1371,7 +943,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1392,7 +964,7 @@ class TestOutput:
             input_tbc="pal_svideo",
             output_file="pal_svideo.mkv",
             output_video_codec=codec_ffv1,
-            output_video_base=VideoBasePAL(),
+            output_video_base=_VIDEO_BASE_PAL,
             output_video_color=VideoColorPAL(
                 bit_depth=10,
                 chroma_subsampling="4:2:2",
@@ -1412,7 +984,7 @@ class TestOutput:
 
         # check video codec
         for k, v in test_case.output_video_codec.items():
-            if isinstance(v, list):
+            if isinstance(v, tuple):
                 for v_item in v:
                     target_field = getattr(video_track, k, None)
                     assert target_field is not None
@@ -1423,18 +995,10 @@ class TestOutput:
                 assert v in target_field
 
         # check video info
-        for field in fields(test_case.output_video_base):
-            if (value := getattr(test_case.output_video_base, field.name)) is not None:
-                target_field = getattr(video_track, field.name, None)
-                assert target_field is not None
-                assert target_field == value
+        _check_track_fields(test_case.output_video_base, video_track)
 
         # check video color
-        for field in fields(test_case.output_video_color):
-            if (value := getattr(test_case.output_video_color, field.name)) is not None:
-                target_field = getattr(video_track, field.name, None)
-                assert target_field is not None
-                assert target_field == value
+        _check_track_fields(test_case.output_video_color, video_track)
 
     def check_audio_tracks(
         self, test_case: OutputTestCase, media_info: MediaInfo
@@ -1443,13 +1007,7 @@ class TestOutput:
         assert len(media_info.audio_tracks) == len(test_case.output_audio_base)
 
         for track_idx, test_track in enumerate(test_case.output_audio_base):
-            audio_track = media_info.audio_tracks[track_idx]
-
-            for field in fields(test_track):
-                if (value := getattr(test_track, field.name)) is not None:
-                    target_field = getattr(audio_track, field.name, None)
-                    assert target_field is not None
-                    assert target_field == value
+            _check_track_fields(test_track, media_info.audio_tracks[track_idx])
 
     def check_metadata(self, test_case: OutputTestCase, media_info: MediaInfo) -> None:
         """Check metadata of output file."""
@@ -1463,12 +1021,25 @@ class TestOutput:
             ):
                 assert target_field == v
 
-    def run_output_validation(self, test_case: OutputTestCase) -> None:
-        """Test output video files with mediainfo."""
+    def run_output_validation(self, test_case: OutputTestCase, tmp_path: Path) -> None:
+        """Test output video files with mediainfo.
+
+        Output is written to tmp_path so cases can run in parallel (e.g. with
+        pytest-xdist) without overwriting each other.
+        """
+        # imported here so collecting or deselecting these tests does not load it
+        from pymediainfo import MediaInfo  # pyright: ignore[reportMissingTypeStubs]
+
         with test_case.expected_exc:
-            main([f"tests/files/{test_case.input_tbc}", *test_case.input_opts])
+            output_file = tmp_path / test_case.output_file
 
-            output_file = Path(f"tests/files/{test_case.output_file}")
+            main(
+                [
+                    f"tests/files/{test_case.input_tbc}",
+                    str(output_file.with_suffix("")),
+                    *test_case.input_opts,
+                ]
+            )
 
             try:
                 assert output_file.is_file()
@@ -1494,8 +1065,8 @@ class TestOutput:
             for test_case in pal_svideo_test_cases
         ),
     )
-    def test_pal_svideo(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_pal_svideo(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1504,8 +1075,8 @@ class TestOutput:
             for test_case in pal_composite_test_cases
         ),
     )
-    def test_pal_composite(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_pal_composite(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1514,8 +1085,8 @@ class TestOutput:
             for test_case in pal_composite_ld_test_cases
         ),
     )
-    def test_pal_composite_ld(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_pal_composite_ld(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1524,8 +1095,8 @@ class TestOutput:
             for test_case in ntsc_svideo_test_cases
         ),
     )
-    def test_ntsc_svideo(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_ntsc_svideo(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1534,8 +1105,8 @@ class TestOutput:
             for test_case in ntsc_composite_test_cases
         ),
     )
-    def test_ntsc_composite(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_ntsc_composite(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1544,8 +1115,8 @@ class TestOutput:
             for test_case in ntsc_composite_ld_test_cases
         ),
     )
-    def test_ntsc_composite_ld(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_ntsc_composite_ld(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1554,8 +1125,8 @@ class TestOutput:
             for test_case in palm_svideo_test_cases
         ),
     )
-    def test_palm_svideo(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_palm_svideo(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -1564,26 +1135,26 @@ class TestOutput:
             for test_case in video_format_test_cases
         ),
     )
-    def test_video_formats(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_video_formats(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
         (pytest.param(test_case, id=test_case.id) for test_case in profile_test_cases),
     )
-    def test_profiles(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_profiles(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
         (pytest.param(test_case, id=test_case.id) for test_case in audio_test_cases),
     )
-    def test_audio_muxing(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_audio_muxing(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
 
     @pytest.mark.parametrize(
         "test_case",
         (pytest.param(test_case, id=test_case.id) for test_case in metadata_test_cases),
     )
-    def test_metadata(self, test_case: OutputTestCase):  # noqa: D102
-        self.run_output_validation(test_case)
+    def test_metadata(self, test_case: OutputTestCase, tmp_path: Path):  # noqa: D102
+        self.run_output_validation(test_case, tmp_path)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tbc_video_export.common.enums import ProcessName, TBCType
+from tbc_video_export.process.process_handler import ProcessHandler
+from tbc_video_export.process.process_state import ProcessState
+from tests.conftest import WrapperGroupTestCase, get_path
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from typing import Any
+
+    from tbc_video_export.program_state import ProgramState
+
+
+class FakeProcess:
+    """Process stand-in that runs until finished or stopped."""
+
+    def __init__(self, process_name: ProcessName, stop_on_last_alive: bool) -> None:
+        self.state = ProcessState()
+        self.wrapper = SimpleNamespace(
+            process_name=process_name,
+            tbc_type=TBCType.NONE,
+            stop_on_last_alive=stop_on_last_alive,
+        )
+        self.stopped = False
+        self._finished = asyncio.Event()
+
+    async def run(self) -> ProcessState:
+        self.state.running = True
+        await self._finished.wait()
+        self.state.ended = True
+        self.state.success = True
+        return self.state
+
+    async def stop(self) -> None:
+        self.stopped = True
+        self.finish()
+
+    def finish(self) -> None:
+        self._finished.set()
+
+
+class TestProcKiller:
+    """Tests for the process handler proc killer."""
+
+    @staticmethod
+    async def _run_proc_killer(
+        state: ProgramState,
+        stop_on_last_alive: tuple[bool, ...],
+        trigger: Callable[[ProcessHandler, list[FakeProcess]], None],
+    ) -> tuple[list[FakeProcess], set[asyncio.Task[Any]]]:
+        """Run the proc killer until the trigger ends it.
+
+        Returns the procs and any tasks left behind by the proc killer.
+        """
+        handler = ProcessHandler(state)
+        procs = [FakeProcess(ProcessName.FFMPEG, s) for s in stop_on_last_alive]
+        proc_tasks = [asyncio.create_task(proc.run()) for proc in procs]
+
+        killer = asyncio.create_task(handler._proc_killer(procs, proc_tasks))
+
+        # allow the procs to start and the killer to wait on them
+        await asyncio.sleep(0)
+        assert not killer.done()
+
+        trigger(handler, procs)
+        await asyncio.wait_for(killer, timeout=1)
+
+        # allow cancelled tasks to finish
+        await asyncio.sleep(0)
+        leftover = asyncio.all_tasks() - {asyncio.current_task(), *proc_tasks}
+
+        for proc in procs:
+            proc.finish()
+
+        await asyncio.gather(*proc_tasks)
+
+        return procs, leftover
+
+    def test_proc_killer_stop_on_last_alive(  # noqa: D102
+        self, program_state: Callable[[list[str], str, str | None], ProgramState]
+    ) -> None:
+        state = program_state([], f"{get_path('pal_svideo')}.tbc", "out_file")
+
+        procs, leftover = asyncio.run(
+            self._run_proc_killer(
+                state, (False, True), lambda _, procs: procs[0].finish()
+            )
+        )
+
+        assert not procs[0].stopped
+        assert procs[1].stopped
+        assert not leftover
+
+    def test_proc_killer_error_event(  # noqa: D102
+        self, program_state: Callable[[list[str], str, str | None], ProgramState]
+    ) -> None:
+        state = program_state([], f"{get_path('pal_svideo')}.tbc", "out_file")
+
+        procs, leftover = asyncio.run(
+            self._run_proc_killer(
+                state,
+                (False, True),
+                lambda handler, _: handler._proc_error_event.set(),
+            )
+        )
+
+        assert not any(proc.stopped for proc in procs)
+        assert not leftover
+
+    def test_proc_killer_stop_event(  # noqa: D102
+        self, program_state: Callable[[list[str], str, str | None], ProgramState]
+    ) -> None:
+        state = program_state([], f"{get_path('pal_svideo')}.tbc", "out_file")
+
+        procs, leftover = asyncio.run(
+            self._run_proc_killer(
+                state,
+                (False, True),
+                lambda handler, _: handler._stop_event.set(),
+            )
+        )
+
+        assert not any(proc.stopped for proc in procs)
+        assert not leftover
+
+
+_DECODE_PROCS = [
+    ProcessName.LD_DROPOUT_CORRECT,
+    ProcessName.LD_CHROMA_DECODER,
+    ProcessName.FFMPEG,
+]
+
+
+class TestWrapperGroups:
+    """Tests for process handler wrapper groups."""
+
+    test_cases = [
+        WrapperGroupTestCase(
+            id="decode only",
+            input_tbc=get_path("pal_composite_ld.tbc"),
+            input_opts=[],
+            tbc_type=TBCType.COMBINED,
+            wrapper_groups=[_DECODE_PROCS],
+        ),
+        WrapperGroupTestCase(
+            id="efm with metadata",
+            input_tbc=get_path("pal_composite_ld.tbc"),
+            input_opts=["--process-efm", "--export-metadata"],
+            tbc_type=TBCType.COMBINED,
+            wrapper_groups=[
+                [ProcessName.LD_PROCESS_EFM, ProcessName.LD_EXPORT_METADATA],
+                _DECODE_PROCS,
+            ],
+        ),
+        WrapperGroupTestCase(
+            id="vbi with efm",
+            input_tbc=get_path("pal_composite_ld.tbc"),
+            input_opts=["--process-vbi", "--process-efm"],
+            tbc_type=TBCType.COMBINED,
+            wrapper_groups=[
+                [ProcessName.LD_PROCESS_VBI, ProcessName.LD_PROCESS_EFM],
+                _DECODE_PROCS,
+            ],
+        ),
+        WrapperGroupTestCase(
+            id="vbi with efm and metadata",
+            input_tbc=get_path("pal_composite_ld.tbc"),
+            input_opts=["--process-vbi", "--process-efm", "--export-metadata"],
+            tbc_type=TBCType.COMBINED,
+            wrapper_groups=[
+                [ProcessName.LD_PROCESS_VBI, ProcessName.LD_PROCESS_EFM],
+                [ProcessName.LD_EXPORT_METADATA],
+                _DECODE_PROCS,
+            ],
+        ),
+        WrapperGroupTestCase(
+            id="vbi with metadata (split)",
+            input_tbc=get_path("pal_svideo.tbc"),
+            input_opts=["--process-vbi", "--export-metadata"],
+            tbc_type=TBCType.LUMA | TBCType.CHROMA,
+            wrapper_groups=[
+                [ProcessName.LD_PROCESS_VBI],
+                [ProcessName.LD_EXPORT_METADATA],
+                [
+                    ProcessName.LD_DROPOUT_CORRECT,
+                    ProcessName.LD_CHROMA_DECODER,
+                    ProcessName.LD_DROPOUT_CORRECT,
+                    ProcessName.LD_CHROMA_DECODER,
+                    ProcessName.FFMPEG,
+                ],
+            ],
+        ),
+        WrapperGroupTestCase(
+            id="two-step (split)",
+            input_tbc=get_path("pal_svideo.tbc"),
+            input_opts=["--two-step"],
+            tbc_type=TBCType.LUMA | TBCType.CHROMA,
+            wrapper_groups=[_DECODE_PROCS, _DECODE_PROCS],
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "test_case",
+        (pytest.param(test_case, id=test_case.id) for test_case in test_cases),
+    )
+    def test_wrapper_groups(  # noqa: D102
+        self,
+        program_state: Callable[[list[str], Path, str | None], ProgramState],
+        test_case: WrapperGroupTestCase,
+    ) -> None:
+        state = program_state(test_case.input_opts, test_case.input_tbc, "out_file")
+        handler = ProcessHandler(state)
+        handler._create_wrapper_groups()
+
+        groups = list(handler._procs)
+
+        assert [
+            [wrapper.process_name for wrapper in group.wrappers] for group in groups
+        ] == test_case.wrapper_groups
+
+        tbc_types = TBCType.NONE
+
+        for wrapper in (wrapper for group in groups for wrapper in group.wrappers):
+            tbc_types |= wrapper.tbc_type
+
+        assert tbc_types & ~TBCType.NONE == test_case.tbc_type
+
+    def test_wrapper_groups_invalidate_commands(  # noqa: D102
+        self, program_state: Callable[[list[str], Path, str | None], ProgramState]
+    ) -> None:
+        state = program_state(
+            ["--process-vbi", "--export-metadata", "--dry-run"],
+            get_path("pal_svideo.tbc"),
+            "out_file",
+        )
+        handler = ProcessHandler(state)
+        handler._create_wrapper_groups()
+
+        vbi_group, metadata_group, _ = handler._procs
+        (export_metadata,) = metadata_group.wrappers
+
+        # cache the command before process vbi replaces the tbc json
+        assert str(get_path("pal_svideo.tbc.json")) in export_metadata.command.data
+
+        for wrapper in vbi_group.wrappers:
+            wrapper.post_fn()
+
+        metadata_group.invalidate_commands()
+
+        assert str(get_path("pal_svideo.vbi.json")) in export_metadata.command.data
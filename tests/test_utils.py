@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
 
-from tbc_video_export.common.utils import ansi
+from tbc_video_export.common.utils import ansi, files
+from tbc_video_export.common.utils.cached_property import cached_property
 from tbc_video_export.common.utils.flatlist import FlatList
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest import LogCaptureFixture
 
 
@@ -130,8 +134,9 @@ class TestUtils:
         data.append(d for d in ["6", "7"])
         data.append(FlatList(["8", "9"]))
         data.append([10, 11] + [12])
+        data.extend(["13", "14"])
 
-        assert str(data) == "1 2 3 4 5 6 7 8 9 10 11 12"
+        assert str(data) == "1 2 3 4 5 6 7 8 9 10 11 12 13 14"
         assert data.data == [
             "1",
             "2",
@@ -145,6 +150,56 @@ class TestUtils:
             "10",
             "11",
             "12",
+            "13",
+            "14",
         ]
 
+        assert list(data) == data.data
+        assert len(data) == 14
         assert data
+
+    def test_cached_property(self) -> None:  # noqa: D102
+        class Counter:
+            calls = 0
+
+            @cached_property
+            def value(self) -> int:
+                self.calls += 1
+                return self.calls
+
+        counter = Counter()
+
+        assert counter.value == 1
+        assert counter.value == 1
+        assert counter.calls == 1
+        assert isinstance(Counter.value, cached_property)
+
+    def test_existing_files(self, tmp_path: Path) -> None:  # noqa: D102
+        (tmp_path / "exists.scc").touch()
+        (tmp_path / "dir.scc").mkdir()
+
+        paths = (
+            tmp_path / "exists.scc",
+            tmp_path / "dir.scc",
+            tmp_path / "missing.scc",
+            tmp_path / "missing" / "file.scc",
+        )
+
+        assert files.get_existing_files(paths) == {tmp_path / "exists.scc"}
+
+    def test_existing_files_unlisted(self, tmp_path: Path) -> None:  # noqa: D102
+        (tmp_path / "exists.scc").touch()
+
+        # names the scan cannot match fall back to is_file()
+        with mock.patch("os.scandir", side_effect=PermissionError):
+            assert files.get_existing_files(
+                (tmp_path / "exists.scc", tmp_path / "missing.scc")
+            ) == {tmp_path / "exists.scc"}
+
+    def test_load_json(self, tmp_path: Path) -> None:  # noqa: D102
+        (json_file := tmp_path / "test.json").write_text('{"fields": [1, 2]}')
+        assert files.load_json(json_file) == {"fields": [1, 2]}
+
+        (json_file := tmp_path / "invalid.json").write_text("{")
+        with pytest.raises(json.JSONDecodeError):
+            files.load_json(json_file)
@@ -13,6 +13,8 @@ from tests.conftest import WrapperTestCase, get_path
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pytest_mock import MockFixture
+
     from tbc_video_export.process.wrapper.wrapper_ffmpeg import WrapperFFmpeg
     from tbc_video_export.program_state import ProgramState
 
@@ -27,43 +29,43 @@ class TestWrappersFFmpeg:
             id="set threads (global)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--threads", "100"],
-            expected_opts=[{"-threads", "100"}],
+            expected_opts=[{"-threads", "100"}, {"-filter_complex_threads", "100"}],
         ),
         WrapperTestCase(
             id="set threads (specific)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--ffmpeg-threads", "100"],
-            expected_opts=[{"-threads", "100"}],
+            expected_opts=[{"-threads", "100"}, {"-filter_complex_threads", "100"}],
         ),
         WrapperTestCase(
             id="set threads (override)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--threads", "200", "--ffmpeg-threads", "100"],
-            expected_opts=[{"-threads", "100"}],
+            expected_opts=[{"-threads", "100"}, {"-filter_complex_threads", "100"}],
         ),
         WrapperTestCase(
             id="set threads (global disable)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--threads", "0"],
-            unexpected_opts=[{"-threads"}],
+            unexpected_opts=[{"-threads"}, {"-filter_complex_threads"}],
         ),
         WrapperTestCase(
             id="set threads (local disable)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--ffmpeg-threads", "0"],
-            unexpected_opts=[{"-threads"}],
+            unexpected_opts=[{"-threads"}, {"-filter_complex_threads"}],
         ),
         WrapperTestCase(
             id="set threads (global set, local disable)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--threads", "100", "--ffmpeg-threads", "0"],
-            unexpected_opts=[{"-threads"}],
+            unexpected_opts=[{"-threads"}, {"-filter_complex_threads"}],
         ),
         WrapperTestCase(
             id="set threads (global disable, local set)",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--threads", "0", "--ffmpeg-threads", "100"],
-            expected_opts=[{"-threads", "100"}],
+            expected_opts=[{"-threads", "100"}, {"-filter_complex_threads", "100"}],
         ),
         WrapperTestCase(
             id="simple audio track",
@@ -311,16 +313,47 @@ class TestWrappersFFmpeg:
             ],
             expected_str=[",format=yuv420p[v_output]"],
         ),
+        WrapperTestCase(
+            id="nvenc low latency",
+            input_tbc=f"{get_path('pal_svideo')}.tbc",
+            input_opts=["--x264", "--nvenc", "--low-latency"],
+            expected_opts=[
+                {"-delay", "0"},
+                {"-zerolatency", "1"},
+                {"-rc-lookahead", "0"},
+                {"-c:v", "h264_nvenc"},
+            ],
+            unexpected_opts=[{"-forced-idr"}],
+        ),
+        WrapperTestCase(
+            id="low latency without nvenc (exception)",
+            input_tbc=f"{get_path('pal_svideo')}.tbc",
+            input_opts=["--x264", "--low-latency"],
+            expected_exc=pytest.raises(exceptions.InvalidOptsError),
+        ),
         WrapperTestCase(
             id="quicksync hwaccel",
             input_tbc=f"{get_path('pal_svideo')}.tbc",
             input_opts=["--x264", "--quicksync", "--hwaccel-device", "TEST"],
             expected_opts=[
+                {"-init_hw_device", "qsv=hw,child_device=TEST"},
+                {"-filter_hw_device", "hw"},
                 {"-hwaccel", "qsv"},
-                {"-qsv_device", "TEST"},
                 {"-c:v", "h264_qsv"},
             ],
-            expected_str=[",format=yuv420p[v_output]"],
+            expected_str=[
+                ",format=yuv420p,hwupload=extra_hw_frames=64,format=qsv[v_output]"
+            ],
+            unexpected_opts=[{"-qsv_device"}],
+        ),
+        WrapperTestCase(
+            id="quicksync hwaccel (default device)",
+            input_tbc=f"{get_path('pal_svideo')}.tbc",
+            input_opts=["--x264", "--quicksync"],
+            expected_opts=[
+                {"-init_hw_device", "qsv=hw"},
+                {"-filter_hw_device", "hw"},
+            ],
         ),
         WrapperTestCase(
             id="amf hwaccel",
@@ -603,6 +636,61 @@ class TestWrappersFFmpeg:
             for e in test_case.unexpected_str:
                 assert not any(e in cmd for cmd in cmds)
 
+    def test_ffmpeg_amf_device_nt(  # noqa: D102
+        self,
+        mocker: MockFixture,
+        program_state: Callable[[list[str], str, str | None], ProgramState],
+        ffmpeg_wrapper_chroma: Callable[
+            [ProgramState, TBCType, ExportMode | None], WrapperFFmpeg
+        ],
+    ) -> None:
+        state = program_state(
+            ["--x264", "--amf", "--hwaccel-device", "1"],
+            "tests/files/pal_svideo.tbc",
+            "out_file",
+        )
+
+        mock_os = mocker.patch("tbc_video_export.process.wrapper.wrapper_ffmpeg.os")
+        mock_os.name = "nt"
+
+        ffmpeg_wrapper = ffmpeg_wrapper_chroma(
+            state, TBCType.CHROMA, ExportMode.CHROMA_MERGE
+        )
+        cmds = ffmpeg_wrapper.command.data
+
+        assert {
+            "-init_hw_device",
+            "d3d11va=amf:1",
+            "-filter_hw_device",
+            "amf",
+            "-c:v",
+            "h264_amf",
+        }.issubset(cmds)
+        assert any(
+            cmd.endswith(",hwupload=extra_hw_frames=64,format=d3d11[v_output]")
+            for cmd in cmds
+        )
+
+    def test_ffmpeg_output_threads(  # noqa: D102
+        self,
+        program_state: Callable[[list[str], str, str | None], ProgramState],
+        ffmpeg_wrapper_chroma: Callable[
+            [ProgramState, TBCType, ExportMode | None], WrapperFFmpeg
+        ],
+    ) -> None:
+        state = program_state(
+            ["--ffmpeg-threads", "8"], "tests/files/pal_svideo.tbc", "out_file"
+        )
+        ffmpeg_wrapper = ffmpeg_wrapper_chroma(
+            state, TBCType.CHROMA, ExportMode.CHROMA_MERGE
+        )
+        cmds = ffmpeg_wrapper.command.data
+
+        # -threads must follow the inputs to apply to the encoder
+        last_input = len(cmds) - cmds[::-1].index("-i") - 1
+        assert cmds.index("-threads") > last_input
+        assert cmds[cmds.index("-threads") + 1] == "8"
+
     def test_ffmpeg_env(  # noqa: D102
         self,
         force_ansi_support_on: None,  # noqa: ARG002